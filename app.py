@@ -1,21 +1,11 @@
+import importlib.util
 import os
 import sys
 import tempfile
 import streamlit as st
 from dotenv import load_dotenv
 import re
-from pathlib import Path
-
-# Try to import optional libraries
-try:
-    from docx import Document
-except ImportError:
-    Document = None
-
-try:
-    import PyPDF2
-except ImportError:
-    PyPDF2 = None
+import time
 
 # Load environment variables
 load_dotenv()
@@ -23,12 +13,30 @@ load_dotenv()
 # Add src to sys.path for importing crew
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
+# crewai/crewai_tools are only imported when an analysis actually runs; just check they are installed
+if importlib.util.find_spec("crewai") is None:
+    st.error("Could not import FactChecker: No module named 'crewai'")
+    st.stop()
+
 try:
-    from fact_checker.crew import FactChecker
+    from fact_checker.transcripts import prefetch_transcript
+    from fact_checker.jobs import get_job_manager
+    from fact_checker.documents import UploadTooLarge, read_upload
+    from fact_checker.progress import TASK_LABELS, TOOL_CALL
+    from fact_checker.results import Verdict
+    from fact_checker import routing, settings
 except ImportError as e:
     st.error(f"Could not import FactChecker: {e}")
     st.stop()
 
+
+
+@st.cache_resource
+def load_job_manager():
+    """Job manager shared across reruns and sessions"""
+    return get_job_manager()
+
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="SatyaGyan - Professional Fact Check",
@@ -465,6 +473,8 @@ with st.container():
         if youtube_url:
             if re.search(r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?#]+)', youtube_url):
                 st.success("✅ Valid YouTube URL detected")
+                # Start pulling the transcript now so the crew finds it locally
+                prefetch_transcript(youtube_url)
             else:
                 st.warning("⚠️ Please enter a valid YouTube URL")
         user_input = youtube_url
@@ -498,97 +508,104 @@ if analyze_button:
         st.error("⚠️ **Input Required:** Please provide content to analyze.")
         st.stop()
 
-    # Processing indicator
-    with st.spinner(
-            "🔍 **SatyaGyan Analysis in Progress** - Our AI agents are researching, analyzing, and verifying your content..."):
+    # Input extraction (the crew itself runs as a background job)
+    with st.spinner("📥 **Preparing your content for analysis...**"):
         input_content = ""
 
         # File processing
         if uploaded_file:
-            suffix = Path(uploaded_file.name).suffix.lower()
             try:
-                if suffix == ".pdf" and PyPDF2:
-                    reader = PyPDF2.PdfReader(uploaded_file)
-                    input_content = "".join([page.extract_text() for page in reader.pages])
-                elif suffix == ".docx" and Document:
-                    doc = Document(uploaded_file)
-                    input_content = "\n".join([p.text for p in doc.paragraphs])
-                elif suffix == ".txt":
-                    raw = uploaded_file.read()
-                    for enc in ["utf-8", "utf-16", "latin-1", "cp1252"]:
-                        try:
-                            input_content = raw.decode(enc)
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    else:
-                        st.error(
-                            "❌ **File Processing Error:** Unable to decode text file. Please ensure UTF-8 encoding.")
-                        st.stop()
-                else:
-                    st.error("❌ **Unsupported Format:** Please upload a PDF, Word document, or text file.")
-                    st.stop()
+                # Spooled to disk and decoded incrementally, so big uploads don't sit in server memory
+                input_content = read_upload(uploaded_file, uploaded_file.name)
+            except UploadTooLarge as e:
+                st.error(f"❌ **File Too Large:** {e}")
+                st.stop()
             except Exception as e:
                 st.error(f"❌ **File Processing Error:** {e}")
                 st.stop()
         else:
             input_content = claim or url or youtube_url
 
-        # Run analysis
-        try:
-            progress = st.progress(0, text="Initializing SatyaGyan system...")
-            progress.progress(20, text="Loading AI agents...")
-            checker = FactChecker()
-            progress.progress(60, text="Executing multi-agent analysis...")
-            result = checker.crew().kickoff(inputs={"input_content": input_content})
-            progress.progress(100, text="Analysis complete!")
-        except Exception as e:
-            st.error(f"❌ **Analysis Error:** {e}")
-            st.stop()
-
-    # Success notification
+    # Hand the check to a background worker; the job ID in the URL survives reruns and reloads
+    input_type = {"📝 Text Claim": routing.CLAIM, "🌐 Website URL": routing.URL,
+                  "📺 YouTube Video": routing.YOUTUBE, "📄 Document Upload": routing.DOCUMENT}.get(mode)
+    job_id = load_job_manager().submit(input_content, input_type=input_type)
+    st.session_state["job_id"] = job_id
+    st.query_params["job"] = job_id
+
+# Job status and results
+job_id = st.query_params.get("job") or st.session_state.get("job_id")
+job = load_job_manager().get(job_id) if job_id else None
+poll_job = False
+
+if job_id and job is None:
+    st.warning("⚠️ This analysis is no longer available. Please launch a new analysis.")
+elif job and not job.finished:
+    st.progress(job.progress, text=job.stage)
+    st.info("🔍 **SatyaGyan Analysis in Progress** - Our AI agents are researching, analyzing, and verifying your content...")
+    if job.tokens:
+        st.caption(f"Tokens used so far: {job.tokens:,}")
+    # Show each finished task (the research summary first) without waiting for the whole pipeline
+    for event in job.partial:
+        with st.expander(f"**✅ {TASK_LABELS.get(event.task, event.task)} complete**", expanded=event is job.partial[-1]):
+            st.markdown(event.output or "")
+    tool_calls = [event for event in job.events if event.kind == TOOL_CALL]
+    if tool_calls:
+        with st.expander("**🛠️ Agent activity**"):
+            for event in tool_calls[-10:]:
+                st.markdown(f"- *{TASK_LABELS.get(event.task, event.task)}*: `{event.detail}`")
+    poll_job = True
+elif job and job.status == "failed":
+    st.error(f"❌ **Analysis Error:** {job.error}")
+
+if job and job.status == "done":
+    result = job.result
+
+    # Success notification (celebrate once per job, not on every rerun)
     st.success("🎉 **Analysis Complete** - Professional verification report generated successfully")
-    st.balloons()
+    if st.session_state.get("celebrated_job") != job.id:
+        st.session_state["celebrated_job"] = job.id
+        st.balloons()
 
     # Results section
     st.markdown("""
     <div class="results-section">
     """, unsafe_allow_html=True)
 
-    result_text = str(result)
-    result_lower = result_text.lower()
+    result_text = result.to_markdown()
+    verdict = result.overall_verdict
 
     st.markdown("### 📊 Verification Result")
 
-    # Determine verdict
-    if "true" in result_lower and "false" not in result_lower and "misleading" not in result_lower:
+    # Verdict comes from the typed per-claim results, not from scanning the report text
+    if not result.claims:
+        st.markdown("""
+        <div class="verdict-container verdict-inconclusive">
+            📋 DETAILED ANALYSIS AVAILABLE
+        </div>
+        """, unsafe_allow_html=True)
+    elif verdict == Verdict.TRUE:
         st.markdown("""
         <div class="verdict-container verdict-true">
             ✅ VERDICT: THE PROVIDED INFORMATION IS TRUE
         </div>
         """, unsafe_allow_html=True)
-    elif "false" in result_lower:
+    elif verdict == Verdict.FALSE:
         st.markdown("""
         <div class="verdict-container verdict-false">
             ❌ VERDICT: THE PROVIDED INFORMATION IS FALSE
         </div>
         """, unsafe_allow_html=True)
-    elif "misleading" in result_lower or "partially" in result_lower:
+    elif verdict in (Verdict.PARTIALLY_TRUE, Verdict.MISLEADING):
         st.markdown("""
         <div class="verdict-container verdict-partial">
             ⚠️ VERDICT: THE PROVIDED INFORMATION IS PARTIALLY ACCURATE
         </div>
         """, unsafe_allow_html=True)
-    elif "inconclusive" in result_lower:
-        st.markdown("""
-        <div class="verdict-container verdict-inconclusive">
-            🔍 VERDICT: REQUIRES FURTHER INVESTIGATION
-        </div>
-        """, unsafe_allow_html=True)
     else:
         st.markdown("""
         <div class="verdict-container verdict-inconclusive">
-            📋 DETAILED ANALYSIS AVAILABLE
+            🔍 VERDICT: REQUIRES FURTHER INVESTIGATION
         </div>
         """, unsafe_allow_html=True)
 
@@ -597,6 +614,24 @@ if analyze_button:
     with st.expander("**Click to view detailed verification report**", expanded=True):
         st.markdown(result_text)
 
+    # Per-run timing breakdown from the job's trace
+    if job.timings:
+        timings = job.timings
+        with st.expander(f"**⏱️ Performance breakdown ({timings['total_seconds']:.1f}s total)**"):
+            st.caption(f"Tokens: {timings['tokens']:,} · Estimated LLM time: "
+                       f"{timings['llm_seconds_estimate']:.1f}s · Trace ID: {timings['trace_id']}")
+            context_tokens = timings.get("context_tokens") or {}
+            if context_tokens.get("tokens_before"):
+                st.caption(f"Verifier context compacted from {context_tokens['tokens_before']:,} "
+                           f"to {context_tokens['tokens_after']:,} tokens")
+            rows = [{"Step": TASK_LABELS.get(name, name), "Seconds": task["seconds"], "Tokens": task["tokens"]}
+                    for name, task in timings["tasks"].items()]
+            rows += [{"Step": name, "Seconds": tool["seconds"], "Calls": tool["calls"],
+                      "Cache hits": tool["cache_hits"], "Bytes": tool["bytes"]}
+                     for name, tool in timings["tools"].items()]
+            if rows:
+                st.dataframe(rows, use_container_width=True, hide_index=True)
+
     st.markdown("</div>", unsafe_allow_html=True)
 
     # Download options
@@ -612,9 +647,23 @@ if analyze_button:
             use_container_width=True
         )
 
+    with col2:
+        st.download_button(
+            "📊 Download as JSON",
+            data=result.model_dump_json(indent=2),
+            file_name="satyagyan_professional_report.json",
+            mime="application/json",
+            use_container_width=True
+        )
+
 # Professional Footer
 st.markdown("""
 <div class="footer">
     © 2025 Shri Kolekar SK - All Rights Reserved
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Keep polling the background job until it finishes
+if poll_job:
+    time.sleep(settings.JOB_POLL_INTERVAL)
+    st.rerun()
@@ -0,0 +1,163 @@
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Set
+
+from . import settings
+from .ratelimit import BATCH, priority
+
+INPUT_FIELDS = ("input_content", "input", "claim", "url", "text")
+
+
+def _row_to_item(row: dict, line_number: int) -> Optional[dict]:
+    content = next((row[name] for name in INPUT_FIELDS if row.get(name)), None)
+    if not content:
+        return None
+    item_id = row.get("id")
+    return {"id": str(line_number if item_id in (None, "") else item_id), "input_content": str(content).strip()}
+
+
+def read_inputs(path) -> Iterator[dict]:
+    """Stream claims/URLs from a JSONL or CSV file as {"id", "input_content"} items"""
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            for line_number, row in enumerate(csv.DictReader(f), start=1):
+                item = _row_to_item(row, line_number)
+                if item:
+                    yield item
+            return
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = {"input_content": line}
+            if isinstance(row, str):
+                row = {"input_content": row}
+            item = _row_to_item(row, line_number)
+            if item:
+                yield item
+
+
+class Checkpoint:
+    """Append-only record of finished item IDs so an interrupted batch can resume"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.done: Set[str] = set()
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self.done = {line.strip() for line in f if line.strip()}
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def mark(self, item_id: str) -> None:
+        self.done.add(item_id)
+        self._file.write(item_id + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def resume_output(output_path) -> Set[str]:
+    """
+    Make an existing output file safe to append to and return the IDs it
+    already holds results for. Failed records (retried on this run), lines
+    torn by a crash and repeated results are dropped, so every item ID ends
+    up in the file at most once however often the batch is resumed.
+    """
+    path = Path(output_path)
+    done: Set[str] = set()
+    if not path.exists():
+        return done
+    tmp = path.with_name(path.name + ".tmp")
+    with open(path, encoding="utf-8") as source, open(tmp, "w", encoding="utf-8") as target:
+        for line in source:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict) or record.get("status") != "done" or str(record.get("id")) in done:
+                continue
+            done.add(str(record["id"]))
+            target.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
+    return done
+
+
+def run_batch(input_path, output_path, workers: int = settings.BATCH_WORKERS,
+              runner: Callable = None, checkpoint_path=None) -> dict:
+    """
+    Fact-check every item of input_path with `workers` crews in parallel,
+    streaming one JSON result per line to output_path. Items already recorded
+    in the checkpoint file or the output file are skipped, so rerunning after
+    a crash resumes without writing any item twice.
+    """
+    if runner is None:
+        from .pipeline import run_fact_check
+        runner = run_fact_check
+
+    checkpoint = Checkpoint(checkpoint_path or f"{output_path}.checkpoint")
+    # A crash between writing a result and checkpointing it leaves the result in the output only
+    for item_id in resume_output(output_path) - checkpoint.done:
+        checkpoint.mark(item_id)
+    write_lock = threading.Lock()
+    stats = {"processed": 0, "failed": 0, "skipped": 0}
+
+    def check(item: dict) -> dict:
+        started = time.perf_counter()
+        record = {"id": item["id"], "input_content": item["input_content"]}
+        try:
+            # Batch work yields outbound capacity to interactive checks
+            with priority(BATCH):
+                result = runner(item["input_content"])
+            record["status"] = "done"
+            if hasattr(result, "overall_verdict"):
+                record["verdict"] = result.overall_verdict.value
+                record["result"] = result.model_dump(mode="json")
+            else:
+                record["result"] = str(result)
+        except Exception as e:
+            record["status"] = "failed"
+            record["error"] = str(e)
+        record["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return record
+
+    def write(record: dict) -> None:
+        with write_lock:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            # Failed items are retried on the next run
+            if record["status"] == "done":
+                checkpoint.mark(record["id"])
+            stats["processed"] += 1
+            stats["failed"] += record["status"] == "failed"
+
+    workers = max(1, workers)
+    with open(output_path, "a", encoding="utf-8") as out, \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-crew") as executor:
+        pending = set()
+        try:
+            for item in read_inputs(input_path):
+                if item["id"] in checkpoint.done:
+                    stats["skipped"] += 1
+                    continue
+                # Keep a bounded window in flight instead of queueing the whole file
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        write(future.result())
+                pending.add(executor.submit(check, item))
+            for future in as_completed(pending):
+                write(future.result())
+        finally:
+            checkpoint.close()
+    return stats
@@ -0,0 +1,63 @@
+from typing import Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from .fetch import get_fetcher
+from .search import format_results, get_search
+from .tools.web_scraping_tool import WebScrapingTool
+from .tools.youtube_tool import YouTubeTranscriptTool
+from .tracing import span
+from .transcripts import extract_video_id, get_transcript_store
+
+
+class CachedWebScrapingTool(WebScrapingTool):
+    """WebScrapingTool backed by the shared page fetcher, so agents share one download per URL"""
+
+    def _run(self, url: str, **kwargs) -> str:
+        with span("tool.web_scraping", url=url) as current:
+            try:
+                text = get_fetcher().fetch_text(url)
+            except Exception as e:
+                current.set(error=str(e))
+                return f"Error scraping {url}: {e}"
+            current.set(payload_bytes=len(text.encode("utf-8")))
+            return text
+
+
+class CachedYouTubeTranscriptTool(YouTubeTranscriptTool):
+    """YouTubeTranscriptTool backed by the shared transcript store (warmed by the UI)"""
+
+    def _run(self, url: str, **kwargs) -> str:
+        video_id = extract_video_id(url)
+        if video_id is None:
+            return super()._run(url, **kwargs)
+        with span("tool.youtube_transcript", video_id=video_id) as current:
+            try:
+                text = get_transcript_store().get(video_id)
+            except Exception as e:
+                current.set(error=str(e))
+                return f"Error fetching transcript for {url}: {e}"
+            current.set(payload_bytes=len(text.encode("utf-8")))
+            return text
+
+
+class SearchInput(BaseModel):
+    search_query: str = Field(..., description="Mandatory search query you want to use to search the internet")
+
+
+class CachedSearchTool(BaseTool):
+    """Drop-in for SerperDevTool that goes through the shared, cached search layer"""
+    name: str = "Search the internet"
+    description: str = "A tool that can be used to search the internet with a search_query."
+    args_schema: Type[BaseModel] = SearchInput
+
+    def _run(self, search_query: str, **kwargs) -> str:
+        with span("tool.search", query=search_query) as current:
+            try:
+                text = format_results(get_search().search(search_query))
+            except Exception as e:
+                current.set(error=str(e))
+                return f"Error searching for {search_query}: {e}"
+            current.set(payload_bytes=len(text.encode("utf-8")))
+            return text
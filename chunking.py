@@ -0,0 +1,51 @@
+import re
+from typing import List
+
+from . import settings
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+
+
+def _units(text: str, max_chars: int) -> List[str]:
+    """Paragraphs, with oversized paragraphs broken into sentences (and hard-split as a last resort)"""
+    units = []
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            units.append(paragraph)
+            continue
+        for sentence in SENTENCE_END.split(paragraph):
+            while len(sentence) > max_chars:
+                units.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence:
+                units.append(sentence)
+    return units
+
+
+def split_into_chunks(text: str, max_chars: int = settings.DOCUMENT_CHUNK_CHARS,
+                      overlap_chars: int = settings.CHUNK_OVERLAP_CHARS) -> List[str]:
+    """
+    Split text into paragraph/sentence aligned chunks of at most max_chars,
+    repeating up to overlap_chars of trailing units at the start of the next
+    chunk so claims spanning a boundary are seen whole at least once.
+    """
+    chunks, current, size = [], [], 0
+    for unit in _units(text, max_chars):
+        if current and size + len(unit) > max_chars:
+            chunks.append("\n\n".join(current))
+            overlap, overlap_size = [], 0
+            for previous in reversed(current):
+                if overlap_size + len(previous) > overlap_chars or overlap_size + len(previous) + len(unit) > max_chars:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += len(previous)
+            current, size = overlap, overlap_size
+        current.append(unit)
+        size += len(unit)
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from . import settings
+from .results import ClaimResult
+from .verdict_cache import normalize_input
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 61) - 1
+NEGATIONS = {"not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without"}
+PRUNE_INTERVAL = 60 * 60
+
+
+def _permutations():
+    params = []
+    for i in range(NUM_PERM):
+        digest = hashlib.sha256(f"satyagyan-minhash-{i}".encode()).digest()
+        params.append((int.from_bytes(digest[:8], "big") % _PRIME or 1, int.from_bytes(digest[8:16], "big") % _PRIME))
+    return params
+
+
+_PERMUTATIONS = _permutations()
+
+
+def shingles(text: str, size: int = 5) -> set:
+    """Character shingles of a claim's normalized words (robust to small rewordings)"""
+    text = " ".join(re.findall(r"\w+", normalize_input(text)))
+    return {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+
+
+def key_terms(text: str) -> frozenset:
+    """Numbers and negations: claims differing in these are different claims however similar"""
+    words = re.findall(r"\w+", normalize_input(text))
+    return frozenset(w for w in words if w in NEGATIONS or any(c.isdigit() for c in w))
+
+
+def minhash(text: str) -> List[int]:
+    """MinHash signature of a claim's shingle set"""
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+              for s in shingles(text)]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+
+@dataclass
+class ClaimMatch:
+    """A previously verified claim close enough to reuse its verdict"""
+    claim: str
+    result: ClaimResult
+    similarity: float
+    verified_at: float
+
+
+class ClaimIndex:
+    """SQLite-backed MinHash/LSH index of verified claims shared across runs"""
+
+    def __init__(self, path=None, threshold: float = settings.CLAIM_INDEX_THRESHOLD):
+        self.path = path or settings.CACHE_DIR / "claims.sqlite3"
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS claim_results ("
+            " id INTEGER PRIMARY KEY,"
+            " normalized TEXT UNIQUE NOT NULL,"
+            " claim TEXT NOT NULL,"
+            " signature TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " verified_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS claim_result_bands ("
+            " band INTEGER NOT NULL,"
+            " bucket TEXT NOT NULL,"
+            " claim_id INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_claim_result_bands ON claim_result_bands(band, bucket);"
+            "CREATE INDEX IF NOT EXISTS idx_claim_result_bands_claim ON claim_result_bands(claim_id);"
+        )
+        self._conn.commit()
+        self._last_prune = 0.0
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete claims older than CLAIM_INDEX_MAX_AGE and their LSH band rows; returns how many"""
+        cutoff = time.time() - settings.CLAIM_INDEX_MAX_AGE
+        with self._lock:
+            self._conn.execute("DELETE FROM claim_result_bands WHERE claim_id IN "
+                               "(SELECT id FROM claim_results WHERE verified_at < ?)", (cutoff,))
+            removed = self._conn.execute("DELETE FROM claim_results WHERE verified_at < ?", (cutoff,)).rowcount
+            self._conn.commit()
+            self._last_prune = time.time()
+        return removed
+
+    @staticmethod
+    def _buckets(signature: List[int]):
+        for band in range(BANDS):
+            rows = signature[band * ROWS:(band + 1) * ROWS]
+            yield band, hashlib.sha1(",".join(map(str, rows)).encode()).hexdigest()
+
+    def add(self, result: ClaimResult, claim: Optional[str] = None) -> None:
+        """
+        Index a verified claim (under `claim` if given, else result.claim),
+        replacing any earlier result for the same normalized text.
+        """
+        claim = claim or result.claim
+        normalized = normalize_input(claim)
+        if not normalized or result.error:
+            return
+        signature = minhash(claim)
+        with self._lock:
+            self._conn.execute("DELETE FROM claim_result_bands WHERE claim_id IN "
+                               "(SELECT id FROM claim_results WHERE normalized = ?)", (normalized,))
+            self._conn.execute("DELETE FROM claim_results WHERE normalized = ?", (normalized,))
+            cursor = self._conn.execute(
+                "INSERT INTO claim_results (normalized, claim, signature, result, verified_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (normalized, claim, json.dumps(signature), result.model_dump_json(), time.time()),
+            )
+            self._conn.executemany(
+                "INSERT INTO claim_result_bands (band, bucket, claim_id) VALUES (?, ?, ?)",
+                [(band, bucket, cursor.lastrowid) for band, bucket in self._buckets(signature)],
+            )
+            self._conn.commit()
+        if time.time() - self._last_prune > PRUNE_INTERVAL:
+            self.prune()
+
+    def lookup(self, claim: str) -> Optional[ClaimMatch]:
+        """Return the most similar indexed claim at or above the threshold, if any"""
+        signature = minhash(claim)
+        max_age = time.time() - settings.CLAIM_INDEX_MAX_AGE
+        with self._lock:
+            candidate_ids = set()
+            for band, bucket in self._buckets(signature):
+                candidate_ids.update(row[0] for row in self._conn.execute(
+                    "SELECT claim_id FROM claim_result_bands WHERE band = ? AND bucket = ?", (band, bucket)))
+            if not candidate_ids:
+                return None
+            placeholders = ",".join("?" * len(candidate_ids))
+            rows = self._conn.execute(
+                f"SELECT claim, signature, result, verified_at FROM claim_results"
+                f" WHERE id IN ({placeholders}) AND verified_at >= ?",
+                (*candidate_ids, max_age),
+            ).fetchall()
+        best = None
+        terms = key_terms(claim)
+        for text, stored_signature, result, verified_at in rows:
+            if key_terms(text) != terms:
+                continue
+            score = similarity(signature, json.loads(stored_signature))
+            if score >= self.threshold and (best is None or score > best.similarity):
+                best = ClaimMatch(text, ClaimResult.model_validate_json(result), score, verified_at)
+        return best
+
+
+def is_indexable(input_content: str) -> bool:
+    """Only short free-text claims are matched by similarity; URLs and documents are not"""
+    text = input_content.strip()
+    return bool(text) and len(text) <= settings.CLAIM_INDEX_MAX_CHARS and not re.match(r"https?://", text)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_claim_index() -> ClaimIndex:
+    """Process-wide claim index shared by the UI and the batch path"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ClaimIndex()
+        return _index
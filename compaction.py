@@ -0,0 +1,90 @@
+import re
+import threading
+from typing import List, Tuple
+
+from . import settings
+from .tracing import span
+
+# tiktoken's encoding is loaded (possibly downloaded) on first use, not when the UI imports this module
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with "
+    "claim claims said says not".split()
+)
+SENTENCE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def _get_encoding():
+    global _encoding, _encoding_loaded
+    with _encoding_lock:
+        if not _encoding_loaded:
+            try:
+                import tiktoken
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                _encoding = None
+            _encoding_loaded = True
+        return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count with tiktoken when installed, otherwise the usual ~4 characters per token"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+def _terms(text: str) -> set:
+    # Decimal numbers stay whole so "4.1" doesn't match every "4" and "1"
+    return {word for word in re.findall(r"\d+(?:[.,]\d+)*|\w+", text.lower())
+            if word[0].isdigit() or (len(word) > 2 and word not in STOPWORDS)}
+
+
+def compact_context(claims: List[str], context: str, max_chars: int = settings.COMPACT_CONTEXT_CHARS) -> str:
+    """
+    Keep only the passages of a research context that share terms with the
+    claims (numbers count double), in their original order, within max_chars.
+    A leading "Source:" line is always kept.
+    """
+    if len(context) <= max_chars:
+        return context
+    header = ""
+    if context.startswith("Source:"):
+        header, _, context = context.partition("\n")
+        header += "\n"
+    passages = [passage.strip() for passage in SENTENCE.split(context) if passage.strip()]
+    wanted = set().union(*(_terms(claim) for claim in claims)) if claims else set()
+
+    def score(passage: str) -> int:
+        return sum(2 if term[0].isdigit() else 1 for term in wanted & _terms(passage))
+
+    ranked = sorted((position for position, passage in enumerate(passages) if score(passage)),
+                    key=lambda position: -score(passages[position]))
+    chosen, used = [], len(header)
+    for position in ranked:
+        if used + len(passages[position]) + 1 > max_chars:
+            continue
+        chosen.append(position)
+        used += len(passages[position]) + 1
+    if not chosen:
+        return header + context[:max_chars - len(header)]
+    return header + "\n".join(passages[position] for position in sorted(chosen))
+
+
+def compact_contexts(claims: List[str], contexts: List[str],
+                     max_chars: int = settings.COMPACT_CONTEXT_CHARS) -> Tuple[List[str], dict]:
+    """
+    Compact each claim's context to its supporting excerpts; returns the contexts
+    and token counts. A context shared by several claims counts once in
+    tokens_before, since that is what one prompt with the full research costs.
+    """
+    with span("compaction", claims=len(claims)) as current:
+        compacted = [compact_context([claim], context, max_chars) for claim, context in zip(claims, contexts)]
+        stats = {"tokens_before": sum(estimate_tokens(context) for context in dict.fromkeys(contexts)),
+                 "tokens_after": sum(estimate_tokens(context) for context in compacted)}
+        current.set(**stats)
+    return compacted, stats
@@ -1,79 +1,121 @@
+import os
+import threading
+
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from .tools.youtube_tool import YouTubeTranscriptTool
-from .tools.web_scraping_tool import WebScrapingTool
+from .cached_tools import CachedSearchTool, CachedWebScrapingTool, CachedYouTubeTranscriptTool
+from .ratelimit import rate_limit_llm
+from .results import ClaimVerdict, VerificationReport
 
-# Try to import SerperDevTool, fallback if not available
-try:
-    from crewai_tools import SerperDevTool
-    SERPER_AVAILABLE = True
-except ImportError:
-    SERPER_AVAILABLE = False
-    print("SerperDevTool not available, web search will be limited")
+_tools = None
+_tools_lock = threading.Lock()
 
-@CrewBase
-class FactChecker():
-    """Fact checking crew for verifying claims and content"""
-    
-    agents_config = 'config/agents.yaml'
-    tasks_config = 'config/tasks.yaml'
 
-    @agent
+def shared_tools() -> dict:
+    """Tool instances built once per process and shared by every agent and run"""
+    global _tools
+    with _tools_lock:
+        if _tools is None:
+            search = CachedSearchTool() if os.getenv("SERPER_API_KEY") else None
+            if search is None:
+                print("SERPER_API_KEY not set, web search will be limited")
+            _tools = {
+                "youtube": CachedYouTubeTranscriptTool(),
+                "web": CachedWebScrapingTool(),
+                "search": search,
+            }
+        return _tools
+
+class FactCheckCrews:
+    """
+    Agents, tasks and crews of one fact check, built on first use from the
+    parsed agent/task config. Each run gets its own instance (so concurrent
+    runs never share crewai state) and it is garbage-collected with the run.
+    """
+
+    def __init__(self, agents_config: dict, tasks_config: dict, llms: dict = None):
+        self.agents_config = agents_config
+        self.tasks_config = tasks_config
+        # Optional per-agent LLM overrides, e.g. a deterministic fake for offline benchmarks
+        self.llms = dict(llms or {})
+        self._built = {}
+
+    def _once(self, name: str, build):
+        # Tasks refer to each other's instances through context, so each is built once per run
+        if name not in self._built:
+            self._built[name] = build()
+        return self._built[name]
+
+    def _llm(self, name: str) -> dict:
+        return {"llm": self.llms[name]} if name in self.llms else {}
+
+    @staticmethod
+    def _rate_limited(agent: Agent) -> Agent:
+        # Every agent's LLM calls share one token bucket, with retry on 429s
+        agent.llm = rate_limit_llm(agent.llm)
+        return agent
+
     def fact_researcher(self) -> Agent:
-        tools = [YouTubeTranscriptTool(), WebScrapingTool()]
-        if SERPER_AVAILABLE:
-            tools.append(SerperDevTool())
-        
-        return Agent(
-            config=self.agents_config['fact_researcher'],
-            verbose=True,
-            tools=tools
-        )
+        def build():
+            shared = shared_tools()
+            tools = [shared["youtube"], shared["web"]]
+            if shared["search"]:
+                tools.append(shared["search"])
+
+            return self._rate_limited(Agent(
+                config=self.agents_config['fact_researcher'],
+                verbose=True,
+                tools=tools,
+                **self._llm('fact_researcher')
+            ))
+        return self._once('fact_researcher', build)
 
-    @agent
     def content_analyzer(self) -> Agent:
-        return Agent(
+        return self._once('content_analyzer', lambda: self._rate_limited(Agent(
             config=self.agents_config['content_analyzer'],
             verbose=True,
-            tools=[YouTubeTranscriptTool(), WebScrapingTool()]
-        )
+            tools=[shared_tools()["youtube"], shared_tools()["web"]],
+            **self._llm('content_analyzer')
+        )))
 
-    @agent
     def fact_verifier(self) -> Agent:
-        tools = []
-        if SERPER_AVAILABLE:
-            tools.append(SerperDevTool())
-            
-        return Agent(
-            config=self.agents_config['fact_verifier'],
-            verbose=True,
-            tools=tools
-        )
+        def build():
+            tools = []
+            if shared_tools()["search"]:
+                tools.append(shared_tools()["search"])
+
+            return self._rate_limited(Agent(
+                config=self.agents_config['fact_verifier'],
+                verbose=True,
+                tools=tools,
+                **self._llm('fact_verifier')
+            ))
+        return self._once('fact_verifier', build)
 
-    @task
     def research_task(self) -> Task:
-        return Task(
+        return self._once('research_task', lambda: Task(
             config=self.tasks_config['research_task'],
+            name='research_task',
             agent=self.fact_researcher()
-        )
+        ))
 
-    @task
     def content_analysis_task(self) -> Task:
-        return Task(
+        return self._once('content_analysis_task', lambda: Task(
             config=self.tasks_config['content_analysis_task'],
+            name='content_analysis_task',
             agent=self.content_analyzer(),
             context=[self.research_task()]
-        )
+        ))
 
-    @task
     def verification_task(self) -> Task:
-        return Task(
+        return self._once('verification_task', lambda: Task(
             config=self.tasks_config['verification_task'],
+            name='verification_task',
             agent=self.fact_verifier(),
-            context=[self.research_task(), self.content_analysis_task()]
-        )
+            context=[self.research_task(), self.content_analysis_task()],
+            output_pydantic=VerificationReport
+        ))
 
-    @crew
     def crew(self) -> Crew:
         """Creates the fact checking crew"""
         return Crew(
@@ -81,4 +123,99 @@ class FactChecker():
             tasks=[self.research_task(), self.content_analysis_task(), self.verification_task()],
             process=Process.sequential,
             verbose=True,
-        )
\ No newline at end of file
+        )
+
+    def analysis_crew(self) -> Crew:
+        """Research and claim extraction only; verification is fanned out per claim"""
+        return Crew(
+            agents=[self.fact_researcher(), self.content_analyzer()],
+            tasks=[self.research_task(), self.content_analysis_task()],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def claim_extraction_crew(self) -> Crew:
+        """Extracts claims from one chunk of a large document passed in as input_content"""
+        analyzer = self.content_analyzer()
+        return Crew(
+            agents=[analyzer],
+            tasks=[Task(config=self.tasks_config['content_analysis_task'], name='content_analysis_task',
+                        agent=analyzer)],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def claim_verification_crew(self) -> Crew:
+        """Verifies a single claim passed in as input_content"""
+        verifier = self.fact_verifier()
+        return Crew(
+            agents=[verifier],
+            tasks=[Task(config=self.tasks_config['verification_task'], name='verification_task',
+                        agent=verifier, output_pydantic=ClaimVerdict)],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+
+@CrewBase
+class FactChecker():
+    """Fact checking crew for verifying claims and content"""
+    
+    agents_config = 'config/agents.yaml'
+    tasks_config = 'config/tasks.yaml'
+    llms = {}
+
+    def crews(self) -> FactCheckCrews:
+        """Builder for this instance's agents and tasks (the crewai CLI path: train, replay, test)"""
+        if "_crews" not in self.__dict__:
+            self._crews = FactCheckCrews(self.agents_config, self.tasks_config, self.llms)
+        return self._crews
+
+    @agent
+    def fact_researcher(self) -> Agent:
+        return self.crews().fact_researcher()
+
+    @agent
+    def content_analyzer(self) -> Agent:
+        return self.crews().content_analyzer()
+
+    @agent
+    def fact_verifier(self) -> Agent:
+        return self.crews().fact_verifier()
+
+    @task
+    def research_task(self) -> Task:
+        return self.crews().research_task()
+
+    @task
+    def content_analysis_task(self) -> Task:
+        return self.crews().content_analysis_task()
+
+    @task
+    def verification_task(self) -> Task:
+        return self.crews().verification_task()
+
+    @crew
+    def crew(self) -> Crew:
+        """Creates the fact checking crew"""
+        return self.crews().crew()
+
+
+_template = None
+_template_lock = threading.Lock()
+
+
+def create_fact_checker(llms: dict = None) -> FactCheckCrews:
+    """
+    Return fresh agents, tasks and crews for one run without re-reading
+    config/agents.yaml and tasks.yaml. The YAML is parsed once by a
+    process-wide FactChecker; each run gets a plain FactCheckCrews built from
+    that config, so nothing per run is kept alive by crewai's memoized
+    @agent/@task methods.
+    llms optionally maps agent names to LLM instances that replace the configured ones.
+    """
+    global _template
+    with _template_lock:
+        if _template is None:
+            _template = FactChecker()
+    return FactCheckCrews(_template.agents_config, _template.tasks_config, llms)
@@ -0,0 +1,236 @@
+import codecs
+import logging
+import mmap
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List
+from xml.etree import ElementTree
+
+from . import settings
+
+# Optional: better guesses for legacy single-byte encodings than the cp1252 fallback
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+logger = logging.getLogger(__name__)
+
+
+class UploadTooLarge(ValueError):
+    """An upload or the text extracted from it exceeds the configured limits"""
+
+
+def _pypdf2():
+    """Import PyPDF2 on first use so importing this module stays cheap"""
+    try:
+        import PyPDF2
+    except ImportError:
+        raise ImportError("PyPDF2 is required for PDF extraction")
+    return PyPDF2
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """Extract pages [start, stop) in a worker process (each worker opens its own reader)"""
+    reader = _pypdf2().PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _too_large(max_bytes: int) -> UploadTooLarge:
+    return UploadTooLarge(f"File is larger than the {max_bytes:,}-byte upload limit")
+
+
+@contextmanager
+def spool_upload(source, suffix: str = "", max_bytes: int = settings.UPLOAD_MAX_BYTES):
+    """
+    Yield a filesystem path for a path or file-like upload, copying the latter
+    to a temporary file in 1 MiB blocks. Raises UploadTooLarge past max_bytes.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if max_bytes and os.path.getsize(source) > max_bytes:
+            raise _too_large(max_bytes)
+        yield os.fspath(source)
+        return
+    if max_bytes and (getattr(source, "size", None) or 0) > max_bytes:
+        raise _too_large(max_bytes)
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            source.seek(0)
+            while True:
+                block = source.read(1024 * 1024)
+                if not block:
+                    break
+                f.write(block)
+                if max_bytes and f.tell() > max_bytes:
+                    raise _too_large(max_bytes)
+        yield path
+    finally:
+        os.unlink(path)
+
+
+def iter_pdf_pages(source, workers: int = settings.PDF_WORKERS,
+                   pages_per_job: int = settings.PDF_PAGES_PER_JOB) -> Iterator[str]:
+    """
+    Yield the text of each PDF page in order. Large documents are split into
+    page ranges extracted in parallel worker processes; only a bounded window
+    of pages is held in memory at a time.
+    """
+    PyPDF2 = _pypdf2()
+
+    with spool_upload(source, ".pdf") as path:
+        page_count = len(PyPDF2.PdfReader(path).pages)
+        if workers <= 1 or page_count <= pages_per_job:
+            for start in range(0, page_count, pages_per_job):
+                yield from _extract_page_range(path, start, min(start + pages_per_job, page_count))
+            return
+
+        ranges = [(start, min(start + pages_per_job, page_count)) for start in range(0, page_count, pages_per_job)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Submit a sliding window so finished ranges are consumed before the rest are extracted
+            window = []
+            for start, stop in ranges:
+                window.append(executor.submit(_extract_page_range, path, start, stop))
+                if len(window) > workers:
+                    yield from window.pop(0).result()
+            for future in window:
+                yield from future.result()
+
+
+def detect_encoding(prefix: bytes, complete: bool = False) -> str:
+    """
+    Guess a text file's encoding from its first bytes: a BOM, NUL-byte
+    patterns of BOM-less UTF-16, valid UTF-8, charset_normalizer if
+    installed, and cp1252 as the last resort. complete=True means the
+    prefix is the whole file.
+    """
+    for bom, encoding in BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    sample = prefix[:4096]
+    if len(sample) >= 4 and sample.count(0) * 4 >= len(sample):
+        odd_nuls = sample[1::2].count(0)
+        return "utf-16-le" if odd_nuls > sample[0::2].count(0) else "utf-16-be"
+    try:
+        # A multi-byte character cut off at the end of the prefix is fine
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=complete)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    if from_bytes is not None:
+        match = from_bytes(prefix).best()
+        if match is not None:
+            return match.encoding
+    return "cp1252"
+
+
+def iter_text(path: str, encoding: str = None, block_size: int = 1024 * 1024,
+              sniff_bytes: int = settings.UPLOAD_SNIFF_BYTES) -> Iterator[str]:
+    """
+    Decode a text file block by block from a memory map, so neither the raw
+    bytes nor a second decoded copy are held in memory. If bytes past the
+    sniffed prefix aren't valid in the detected encoding (e.g. an ASCII
+    header followed by cp1252 text), the encoding is detected again from the
+    first bad byte and decoding continues from there; only bytes invalid in
+    that encoding too become U+FFFD.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        encoding = encoding or detect_encoding(mapped[:sniff_bytes], complete=size <= sniff_bytes)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+        view = memoryview(mapped)
+        try:
+            start = 0
+            while start < size:
+                held = len(decoder.getstate()[0])
+                try:
+                    text = decoder.decode(view[start:start + block_size], final=start + block_size >= size)
+                except UnicodeDecodeError as e:
+                    # e.start counts from the bytes held back at the end of the previous block
+                    bad = start - held + e.start
+                    head = decoder.decode(view[start:bad], final=True) if bad > start else ""
+                    if head:
+                        yield head
+                    start = bad
+                    fallback = detect_encoding(mapped[start:start + sniff_bytes],
+                                               complete=start + sniff_bytes >= size)
+                    if codecs.lookup(fallback).name == codecs.lookup(encoding).name:
+                        fallback = "cp1252"
+                    logger.info("%s: not valid %s after byte %d, decoding the rest as %s",
+                                Path(path).name, encoding, start, fallback)
+                    encoding = fallback
+                    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                    continue
+                start += block_size
+                if text:
+                    yield text
+        finally:
+            view.release()
+
+
+def iter_docx_paragraphs(path: str) -> Iterator[str]:
+    """
+    Stream paragraph texts (tables included) out of word/document.xml with
+    iterparse, clearing each paragraph once read instead of building the
+    whole document tree the way python-docx does.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as document:
+        parts = []
+        for _, element in ElementTree.iterparse(document, events=("end",)):
+            if element.tag == WORD_NS + "t":
+                parts.append(element.text or "")
+            elif element.tag == WORD_NS + "tab":
+                parts.append("\t")
+            elif element.tag in (WORD_NS + "br", WORD_NS + "cr"):
+                parts.append("\n")
+            elif element.tag == WORD_NS + "p":
+                yield "".join(parts)
+                parts = []
+                element.clear()
+
+
+def _bounded(pieces: Iterable[str], separator: str, max_chars: int) -> str:
+    """Join pieces, giving up as soon as the text would exceed max_chars"""
+    joined, size = [], 0
+    for piece in pieces:
+        size += len(piece) + (len(separator) if joined else 0)
+        if max_chars and size > max_chars:
+            raise UploadTooLarge(f"Document text is longer than {max_chars:,} characters")
+        joined.append(piece)
+    return separator.join(joined)
+
+
+def read_upload(source, name: str, max_bytes: int = settings.UPLOAD_MAX_BYTES,
+                max_chars: int = settings.UPLOAD_MAX_CHARS) -> str:
+    """
+    Text of an uploaded .txt, .pdf or .docx file. The upload is spooled to
+    disk once and parsed from there; raises UploadTooLarge past either limit
+    and ValueError for unsupported formats.
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix not in (".txt", ".pdf", ".docx"):
+        raise ValueError("Unsupported format: please upload a PDF, Word document, or text file")
+    with spool_upload(source, suffix, max_bytes) as path:
+        if suffix == ".pdf":
+            return _bounded(iter_pdf_pages(path), "\n", max_chars)
+        if suffix == ".docx":
+            try:
+                return _bounded(iter_docx_paragraphs(path), "\n", max_chars)
+            except (zipfile.BadZipFile, KeyError, ElementTree.ParseError):
+                raise ValueError("Not a valid Word (.docx) document")
+        return _bounded(iter_text(path), "", max_chars)
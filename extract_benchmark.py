@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Tuple
+
+from . import settings
+from .compaction import estimate_tokens
+from .extraction import extract_page, lxml
+from .fetch import BeautifulSoup, clean_html
+
+CORPUS_DIR = settings.BASE_DIR / "benchmarks" / "pages"
+
+_WORDS = ("government officials reported that inflation rose sharply during the third quarter while "
+          "unemployment figures remained stable across most regions according to the latest survey").split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.sample(_WORDS, 12)
+    words.insert(rng.randrange(12), f"{rng.randint(2, 98)}.{rng.randint(0, 9)}%")
+    return " ".join(words).capitalize() + ", officials said."
+
+
+def synthetic_page(seed: int, paragraphs: int = 30) -> str:
+    """
+    A deterministic news page shaped like the heavy ones we scrape: inline
+    scripts and JSON blobs, mega-menu navigation, ad slots, share bars,
+    related-story rails, comments and a long footer around the article.
+    """
+    rng = random.Random(seed)
+    menu = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(120))
+    article = "".join(f"<p>{' '.join(_sentence(rng) for _ in range(4))}</p>" for _ in range(paragraphs))
+    related = "".join(f'<li><a href="/story/{i}">{_sentence(rng)}</a></li>' for i in range(40))
+    comments = "".join(f'<div class="comment"><p>{_sentence(rng)}</p></div>' for _ in range(60))
+    script = "<script>window.__STATE__=" + json.dumps({"items": [_sentence(rng) for _ in range(200)]}) + "</script>"
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>Story {seed} | Example News</title>"
+        f'<meta property="og:title" content="Inflation report {seed}">'
+        '<meta name="author" content="Jane Reporter">'
+        '<meta property="article:published_time" content="2024-05-01T08:00:00Z">'
+        f"<style>{'.x{color:red}' * 500}</style>{script}</head><body>"
+        f'<header class="masthead"><nav class="mega-menu"><ul>{menu}</ul></nav></header>'
+        '<div class="ad-slot">Advertisement</div>'
+        '<div class="cookie-consent"><p>We use cookies to improve your experience on our site.</p></div>'
+        f'<main><article class="story-body"><h1>Inflation report {seed}</h1>'
+        '<div class="share-bar"><a href="#">Share</a><a href="#">Tweet</a></div>'
+        f"{article}</article>"
+        f'<aside class="related"><ul>{related}</ul></aside></main>'
+        f'<section id="comments">{comments}</section>'
+        f'<footer><ul>{menu}</ul><p>Copyright Example News. All rights reserved.</p></footer>'
+        f"{script}</body></html>"
+    )
+
+
+def load_corpus(directory: Path = CORPUS_DIR, synthetic: int = 20) -> Tuple[str, dict]:
+    """
+    Saved *.html pages from directory, or generated pages when there are none;
+    returns which of the two it is ("saved" or "synthetic") with the pages.
+    """
+    pages = {path.name: path.read_text(encoding="utf-8", errors="replace")
+             for path in sorted(Path(directory).glob("*.html"))}
+    if pages:
+        return "saved", pages
+    return "synthetic", {f"synthetic-{seed}.html": synthetic_page(seed) for seed in range(synthetic)}
+
+
+def measure(extract, html: str, repeats: int) -> dict:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        text = extract(html)
+        samples.append(time.perf_counter() - start)
+    return {"seconds": statistics.median(samples), "chars": len(text), "tokens": estimate_tokens(text)}
+
+
+def main():
+    """
+    Compare the old full-page BeautifulSoup text with the readability extractor
+    on a corpus of saved pages: median parse time and output size per page.
+    Usage: extract_benchmark [pages_dir] [repeats] [output.json]
+    """
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else CORPUS_DIR
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    source, corpus = load_corpus(directory)
+    if source == "synthetic":
+        print(f"No saved pages in {directory}: using {len(corpus)} synthetic pages instead")
+    extractors = {"readability": lambda html: extract_page(html).text}
+    if BeautifulSoup is not None:
+        extractors["soup"] = clean_html
+    else:
+        print("bs4 not installed: no BeautifulSoup baseline")
+
+    report = {"parser": "lxml" if lxml is not None else "html.parser (streaming)",
+              "corpus": {"source": source, "directory": str(directory)}, "pages": {}}
+    for name, html in corpus.items():
+        report["pages"][name] = {"html_bytes": len(html.encode("utf-8")),
+                                 **{label: measure(extract, html, repeats) for label, extract in extractors.items()}}
+
+    totals = {label: {key: sum(page[label][key] for page in report["pages"].values())
+                      for key in ("seconds", "chars", "tokens")} for label in extractors}
+    report["totals"] = totals
+    print(f"{len(corpus)} {source} page(s), {report['parser']}")
+    for label, total in totals.items():
+        print(f"  {label:<12} {total['seconds'] * 1000:9.1f} ms  {total['chars']:>10} chars  {total['tokens']:>9} tokens")
+    if "soup" in totals:
+        soup, readability = totals["soup"], totals["readability"]
+        print(f"  speedup x{soup['seconds'] / max(readability['seconds'], 1e-9):.1f}, "
+              f"{1 - readability['tokens'] / max(soup['tokens'], 1):.0%} fewer tokens")
+
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import re
+from dataclasses import dataclass, field
+from html import unescape
+from html.parser import HTMLParser
+from typing import Dict
+
+# lxml is much faster than BeautifulSoup; without it a streaming html.parser pass is used
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# Forms are kept: some sites (e.g. ASP.NET) wrap the whole page in one; their controls are dropped instead
+DROP_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "button", "select", "textarea",
+             "nav", "footer", "header", "aside", "menu", "dialog", "canvas", "object", "embed"}
+# Elements that never have content or an end tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param",
+             "source", "track", "wbr"}
+# Page-level wrappers are never skipped for their class/id hints (e.g. <body class="has-sidebar">)
+WRAPPER_TAGS = {"html", "body", "form", "article"}
+BLOCK_TAGS = {"p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote", "pre", "td", "dd", "dt",
+              "figcaption", "div", "section", "article", "main", "br", "tr", "table", "ul", "ol"}
+CONTENT_TAGS = ("p", "pre", "blockquote", "li", "h2", "h3", "h4", "td", "figcaption")
+# Readability's "unlikely candidates": class/id hints of navigation, ads and widgets. Hints must
+# start a word ("nav" matches "navbar" and "site-nav", not "canvas"); "ad"/"ads" must be the whole
+# word, so "ad-slot" matches but "lead-paragraph" and "address" don't
+BOILERPLATE = re.compile(
+    r"(?<![a-z0-9])(?:nav|menu|footer|sidebar|comment|share|social|promo|advert|ads?(?![a-z0-9])|sponsor|"
+    r"cookie|consent|subscribe|newsletter|related|recommend|breadcrumb|popup|modal|banner|masthead|widget|"
+    r"outbrain|taboola)",
+    re.IGNORECASE,
+)
+POSITIVE = re.compile(r"article|body|content|entry|main|page|post|story|text", re.IGNORECASE)
+MIN_CONTENT_CHARS = 200
+
+
+@dataclass
+class ExtractedPage:
+    """Main text of a page plus the metadata the agents care about"""
+    text: str
+    title: str = ""
+    author: str = ""
+    published: str = ""
+    meta: Dict[str, str] = field(default_factory=dict)
+
+    def to_text(self) -> str:
+        header = [f"{label}: {value}" for label, value in
+                  (("Title", self.title), ("Author", self.author), ("Published", self.published)) if value]
+        return "\n".join(header + ([""] if header else []) + [self.text]).strip()
+
+
+def _collapse(text: str) -> str:
+    return " ".join(text.split())
+
+
+class _PlainText(HTMLParser):
+    """All text outside scripts and styles, one line per block: the old full-page cleaner"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._hidden = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style", "noscript", "template"):
+            self._hidden += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style", "noscript", "template"):
+            self._hidden = max(0, self._hidden - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._hidden:
+            self.parts.append(data)
+
+
+def _plain_text(html: str) -> str:
+    """
+    Fallback for pages the extractor finds too little on: every visible line of
+    the original markup, like fetch.clean_html but without needing bs4.
+    """
+    parser = _PlainText()
+    parser.feed(html)
+    parser.close()
+    return "\n".join(line for line in (_collapse(line) for line in "".join(parser.parts).splitlines()) if line)
+
+
+def _with_fallback(text: str, html: str) -> str:
+    if len(text) >= MIN_CONTENT_CHARS:
+        return text
+    full = _plain_text(html)
+    return full if len(full) > len(text) else text
+
+
+def _metadata(meta: Dict[str, str], fallback_title: str = "") -> dict:
+    """Title, author and publication date from OpenGraph/article/schema.org meta tags"""
+    def first(*names):
+        return next((_collapse(meta[name]) for name in names if meta.get(name)), "")
+    return {
+        "title": first("og:title", "twitter:title", "title") or _collapse(fallback_title),
+        "author": first("author", "article:author", "parsely-author", "sailthru.author", "dc.creator",
+                        "itemprop:author"),
+        "published": first("article:published_time", "datepublished", "itemprop:datepublished", "date",
+                           "pubdate", "dc.date", "parsely-pub-date", "time:datetime"),
+    }
+
+
+def _extract_lxml(html: str) -> ExtractedPage:
+    root = lxml.html.fromstring(html)
+    meta = {}
+    for element in root.iter("meta"):
+        name = (element.get("property") or element.get("name") or "").lower()
+        if name and element.get("content"):
+            meta.setdefault(name, element.get("content"))
+    for element in root.xpath("//*[@itemprop]"):
+        key = "itemprop:" + element.get("itemprop").lower()
+        meta.setdefault(key, element.get("content") or element.get("datetime") or element.text_content())
+    time_element = next(iter(root.xpath("//time[@datetime]")), None)
+    if time_element is not None:
+        meta.setdefault("time:datetime", time_element.get("datetime"))
+    title_element = root.find(".//title")
+    title = title_element.text_content() if title_element is not None else ""
+
+    for element in list(root.iter(*DROP_TAGS)):
+        element.drop_tree()
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str) or element.getparent() is None:
+            continue
+        hints = f"{element.get('class', '')} {element.get('id', '')}"
+        if BOILERPLATE.search(hints) and not POSITIVE.search(hints) and element.tag not in WRAPPER_TAGS:
+            element.drop_tree()
+
+    # Score containers by the paragraphs they hold, readability-style
+    scores = {}
+    for paragraph in root.iter(*CONTENT_TAGS):
+        text = _collapse(paragraph.text_content())
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        for ancestor, share in ((parent, 1.0), (parent.getparent() if parent is not None else None, 0.5)):
+            if ancestor is not None:
+                scores[ancestor] = scores.get(ancestor, 0) + score * share
+
+    def link_density(element) -> float:
+        text_length = len(element.text_content()) or 1
+        return sum(len(link.text_content()) for link in element.iter("a")) / text_length
+
+    best = max(scores, key=lambda element: scores[element] * (1 - link_density(element)), default=None)
+    explicit = next(iter(root.xpath("//article|//*[@itemprop='articleBody']|//main")), None)
+    container = best if best is not None else (explicit if explicit is not None else root)
+
+    blocks = []
+    for element in container.iter("h1", *CONTENT_TAGS):
+        text = _collapse(element.text_content())
+        if text and not (element.tag == "li" and link_density(element) > 0.5):
+            blocks.append(text)
+    text = _with_fallback("\n".join(dict.fromkeys(blocks)), html)
+    return ExtractedPage(text=text, meta=meta, **_metadata(meta, title))
+
+
+class _StreamingExtractor(HTMLParser):
+    """
+    Single pass over the markup without building a tree: skips boilerplate
+    subtrees, collects block-level text with its link density, reads meta tags.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.title = ""
+        self.blocks = []
+        self._stack = []
+        self._skip_depth = 0
+        self._buffer = []
+        self._link_chars = 0
+        self._in_link = 0
+        self._in_title = False
+
+    def _flush(self):
+        text = _collapse("".join(self._buffer))
+        if text:
+            self.blocks.append((text, self._link_chars / max(1, len(text))))
+        self._buffer, self._link_chars = [], 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta":
+            name = (attrs.get("property") or attrs.get("name") or attrs.get("itemprop") or "").lower()
+            if name and attrs.get("content"):
+                self.meta.setdefault(name, attrs["content"])
+            return
+        if tag == "time" and attrs.get("datetime"):
+            self.meta.setdefault("time:datetime", attrs["datetime"])
+        if tag in VOID_TAGS:
+            # Never closed, so they must not open a (skipped) subtree
+            return
+        hints = f"{attrs.get('class') or ''} {attrs.get('id') or ''}"
+        skip = tag in DROP_TAGS or (tag not in WRAPPER_TAGS and BOILERPLATE.search(hints) is not None
+                                    and not POSITIVE.search(hints))
+        self._stack.append((tag, skip))
+        if skip:
+            self._skip_depth += 1
+        if tag == "title":
+            self._in_title = True
+        elif tag == "a":
+            self._in_link += 1
+        elif tag in BLOCK_TAGS and not self._skip_depth:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        # Close implicitly ended elements too (e.g. unclosed <p> or <li>)
+        while self._stack:
+            open_tag, skip = self._stack.pop()
+            if skip:
+                self._skip_depth -= 1
+            if open_tag == "a":
+                self._in_link = max(0, self._in_link - 1)
+            if open_tag == tag:
+                break
+        if tag == "title":
+            self._in_title = False
+        elif tag in BLOCK_TAGS and not self._skip_depth:
+            self._flush()
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self._buffer.append(data)
+            if self._in_link:
+                self._link_chars += len(data.strip())
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def _extract_streaming(html: str) -> ExtractedPage:
+    parser = _StreamingExtractor()
+    parser.feed(html)
+    parser.close()
+    # Keep prose-like blocks: long enough and not mostly links
+    blocks = [text for text, density in parser.blocks if len(text) >= 25 and density < 0.5]
+    text = _with_fallback("\n".join(dict.fromkeys(blocks)), html)
+    return ExtractedPage(text=text, meta=parser.meta, **_metadata(parser.meta, unescape(parser.title)))
+
+
+def extract_page(html: str) -> ExtractedPage:
+    """Main content and metadata of an HTML page (lxml if installed, otherwise streaming html.parser)"""
+    if lxml is not None:
+        try:
+            return _extract_lxml(html)
+        except (ValueError, lxml.etree.ParserError):
+            pass
+    return _extract_streaming(html)
+
+
+def extract_text(html: str) -> str:
+    """PageFetcher cleaner: boilerplate-free main text preceded by title/author/date lines"""
+    return extract_page(html).to_text()
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import settings
+from .extraction import extract_text
+from .ratelimit import RETRYABLE_STATUS, get_limiter
+from .tracing import annotate
+
+# Try to import BeautifulSoup, fallback to raw text if not available
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+USER_AGENT = "Mozilla/5.0 (compatible; SatyaGyan/1.0; +fact-checking bot)"
+
+
+def clean_html(html: str) -> str:
+    """Strip markup, scripts and styles and collapse whitespace"""
+    if BeautifulSoup is None:
+        return html
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(["script", "style", "noscript"]):
+        element.decompose()
+    lines = (line.strip() for line in soup.get_text("\n").splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+CLEANERS = {"readability": extract_text, "soup": clean_html}
+
+
+class PageFetcher:
+    """Process-wide page fetcher with pooled connections and an on-disk text cache"""
+
+    def __init__(self, cache_dir=None, max_bytes: int = settings.PAGE_CACHE_MAX_BYTES,
+                 fresh_for: int = settings.PAGE_CACHE_FRESH_SECONDS,
+                 timeout: int = settings.FETCH_TIMEOUT, cleaner=None):
+        self.cache_dir = Path(cache_dir or settings.CACHE_DIR / "pages")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fresh_for = fresh_for
+        self.timeout = timeout
+        self.cleaner = cleaner or CLEANERS.get(settings.HTML_EXTRACTOR, extract_text)
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        # No adapter retries: the scrape limiter is the only retry layer, so its backoff and time cap hold
+        adapter = HTTPAdapter(pool_connections=settings.FETCH_POOL_SIZE,
+                              pool_maxsize=settings.FETCH_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._size_lock = threading.Lock()
+        self._total_bytes = self._scan()[1]
+
+    def _entry_path(self, url: str):
+        return self.cache_dir / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self, url: str) -> Optional[dict]:
+        path = self._entry_path(url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Text produced by a different extractor is refetched rather than mixed in
+        return entry if entry.get("cleaner") == self.cleaner.__name__ else None
+
+    def _store(self, url: str, entry: dict) -> None:
+        path = self._entry_path(url)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+        with self._size_lock:
+            self._total_bytes += size - replaced
+            over = self._total_bytes > self.max_bytes
+        if over:
+            self._evict()
+
+    def _touch(self, url: str) -> None:
+        try:
+            os.utime(self._entry_path(url))
+        except OSError:
+            pass
+
+    def _scan(self):
+        """(mtime, size, path) of every cached page, oldest first, and their total size"""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries, sum(size for _, size, _ in entries)
+
+    def _evict(self) -> None:
+        """
+        Drop least recently used pages down to 90% of max_bytes. Only runs once
+        the running total passes the limit, so the directory isn't scanned on
+        every write; the rescan also corrects drift from other processes.
+        """
+        with self._size_lock:
+            entries, total = self._scan()
+            for _, size, path in entries:
+                if total <= self.max_bytes * 0.9:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+            self._total_bytes = total
+
+    def _get(self, url: str, headers: dict):
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code in RETRYABLE_STATUS:
+            # Raise so the limiter backs off and retries
+            response.raise_for_status()
+        return response
+
+    def fetch_text(self, url: str, revalidate: bool = False) -> str:
+        """
+        Return the cleaned text of a page, revalidating stale copies with conditional
+        requests. revalidate=True always asks the server, e.g. when monitoring for edits.
+        Concurrent fetches of one URL share a single download; no lock is held while
+        the limiter waits or backs off, so other URLs are never held up behind it.
+        """
+        with self._lock:
+            future = self._in_flight.get(url)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[url] = future
+        if not owner:
+            annotate(cache="coalesced")
+            return future.result()
+
+        try:
+            text = self._fetch(url, revalidate)
+            future.set_result(text)
+            return text
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(url, None)
+
+    def _fetch(self, url: str, revalidate: bool) -> str:
+        entry = self._load(url)
+        if entry and not revalidate and time.time() - entry["fetched_at"] < self.fresh_for:
+            self._touch(url)
+            annotate(cache="fresh")
+            return entry["text"]
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = get_limiter("scrape").call(self._get, url, headers)
+        if response.status_code == 304 and entry:
+            entry["fetched_at"] = time.time()
+            self._store(url, entry)
+            annotate(cache="revalidated")
+            return entry["text"]
+        response.raise_for_status()
+
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "cleaner": self.cleaner.__name__,
+            "text": self.cleaner(response.text),
+        }
+        self._store(url, entry)
+        annotate(cache="miss", download_bytes=len(response.content))
+        return entry["text"]
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher() -> PageFetcher:
+    """Shared fetcher so every agent and run reuses one session and cache"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = PageFetcher()
+        return _fetcher
+
+
+def configure_fetcher(**kwargs) -> PageFetcher:
+    """Replace the shared fetcher, e.g. with a private cache directory or a recorded session"""
+    global _fetcher
+    with _fetcher_lock:
+        _fetcher = PageFetcher(**kwargs)
+        return _fetcher
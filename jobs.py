@@ -0,0 +1,186 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from . import settings
+from .progress import (CLAIM_VERIFIED, TASK_FINISHED, TASK_LABELS, TASK_PROGRESS, TASK_STARTED,
+                       TOOL_CALL, ProgressEvent)
+from .ratelimit import BATCH, INTERACTIVE, priority
+from .results import FactCheckResult
+from .routing import effective_type
+from .tracing import trace
+from .verdict_cache import cache_key
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """State of one background fact check, polled by the UI"""
+    id: str
+    input_content: str
+    input_type: Optional[str] = None
+    priority: int = INTERACTIVE
+    status: str = QUEUED
+    stage: str = "Waiting for a free analysis worker..."
+    progress: int = 0
+    events: List[ProgressEvent] = field(default_factory=list)
+    tokens: int = 0
+    result: Optional[FactCheckResult] = None
+    # Identical submissions that attached to this job instead of starting their own
+    coalesced: int = 0
+    timings: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+    @property
+    def partial(self) -> List[ProgressEvent]:
+        """Task outputs available so far, in completion order"""
+        return [event for event in self.events if event.kind == TASK_FINISHED]
+
+    def record(self, event: ProgressEvent) -> None:
+        """Apply a progress event to the job's stage, progress bar and token count"""
+        with self._lock:
+            self._apply(event)
+
+    def _apply(self, event: ProgressEvent) -> None:
+        self.events.append(event)
+        self.tokens += event.tokens
+        label = TASK_LABELS.get(event.task, event.task)
+        if event.kind == TASK_STARTED:
+            self.stage = f"{label}... {event.detail}".strip()
+        elif event.kind == TOOL_CALL:
+            self.stage = f"{label} — {event.detail}"
+        elif event.kind == CLAIM_VERIFIED:
+            self.stage = f"{label} — {event.detail}"
+            self.progress = min(95, self.progress + 5)
+        elif event.kind == TASK_FINISHED:
+            self.stage = f"{label} complete"
+            self.progress = min(95, max(self.progress, TASK_PROGRESS.get(event.task, self.progress)))
+
+
+class QueueFull(Exception):
+    """Too many unfinished jobs; the caller should retry later"""
+
+
+class JobManager:
+    """
+    Runs fact checks on background executors so Streamlit reruns never block on
+    a crew. Jobs at BATCH priority or lower get their own workers and queue
+    budget, so a large batch never delays or crowds out interactive checks.
+    """
+
+    def __init__(self, runner: Callable = None, max_workers: int = settings.JOB_WORKERS,
+                 retention: int = settings.JOB_RETENTION_SECONDS, max_queued: int = 0,
+                 batch_workers: int = 0, max_batch_queued: int = 0):
+        if runner is None:
+            from .pipeline import run_fact_check
+            runner = run_fact_check
+        self.runner = runner
+        self.retention = retention
+        self.max_workers = max_workers
+        # 0 shares the interactive workers (FIFO, as the UI needs no separation)
+        self.batch_workers = batch_workers
+        # 0 means unbounded; otherwise submit raises QueueFull beyond this many unfinished jobs of that kind
+        self.max_queued = max_queued
+        self.max_batch_queued = max_batch_queued
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[str, str] = {}
+        self._unfinished = {False: 0, True: 0}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fact-check-job")
+        self._batch_executor = (ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="fact-check-batch")
+                                if batch_workers else self._executor)
+
+    def submit(self, input_content: str, input_type: Optional[str] = None, level: int = INTERACTIVE) -> str:
+        """
+        Queue a fact check and return its job ID immediately. If the same input
+        (after normalization) is already queued or running, return that job instead,
+        unless it is batch work still waiting in line behind other batch jobs.
+        """
+        key = cache_key(input_content, input_type=effective_type(input_content, input_type))
+        batch = level >= BATCH
+        with self._lock:
+            self._prune()
+            active = self._jobs.get(self._active.get(key))
+            if active is not None and not active.finished and (active.priority <= level or active.status != QUEUED):
+                active.coalesced += 1
+                return active.id
+            limit = self.max_batch_queued if batch else self.max_queued
+            if limit and self._unfinished[batch] >= limit:
+                kind = "batch checks" if batch else "checks"
+                raise QueueFull(f"{self._unfinished[batch]} {kind} already queued or running")
+            job = Job(id=uuid.uuid4().hex, input_content=input_content, input_type=input_type, priority=level)
+            self._jobs[job.id] = job
+            self._active[key] = job.id
+            self._unfinished[batch] += 1
+        (self._batch_executor if batch else self._executor).submit(self._run, job, key)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> dict:
+        """Job counts by status, for health checks"""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+        counts = {status: statuses.count(status) for status in (QUEUED, RUNNING, DONE, FAILED)}
+        return {"workers": self.max_workers, "max_queued": self.max_queued,
+                "batch_workers": self.batch_workers, "max_batch_queued": self.max_batch_queued, **counts}
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _run(self, job: Job, key: str) -> None:
+        job.status = RUNNING
+        job.stage = "Loading AI agents..."
+        job.progress = 5
+        run = None
+        status, stage = FAILED, "Analysis failed"
+        try:
+            with priority(job.priority), trace("fact_check", job_id=job.id) as run:
+                job.result = self.runner(job.input_content, on_event=job.record, input_type=job.input_type)
+            status, stage = DONE, "Analysis complete!"
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            if run is not None:
+                job.timings = run.breakdown()
+            job.progress = 100
+            job.finished_at = time.time()
+            # Status flips last, under the lock: a finished job always has its timings and finished_at
+            with self._lock:
+                job.stage = stage
+                job.status = status
+                self._unfinished[job.priority >= BATCH] -= 1
+                if self._active.get(key) == job.id:
+                    del self._active[key]
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Process-wide job manager shared by every browser session"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
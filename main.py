@@ -1,10 +1,13 @@
 #!/usr/bin/env python
+import json
 import os
 import sys
 import warnings
 from datetime import datetime
 
-from crew import FactChecker
+from .crew import FactChecker
+from .batch import run_batch
+from .monitor import monitor_urls
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
 def run():
@@ -60,6 +63,42 @@ def test():
     except Exception as e:
         raise Exception(f"❌ An error occurred while testing the crew: {e}")
 
+def batch():
+    """
+    Fact-check every claim/URL in a JSONL or CSV file with parallel crews.
+    Usage: fact_checker-batch <input.jsonl|input.csv> <output.jsonl> [workers]
+    """
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    try:
+        kwargs = {"workers": workers} if workers else {}
+        stats = run_batch(sys.argv[1], sys.argv[2], **kwargs)
+        print(f"✅ Batch finished: {stats['processed']} checked, {stats['failed']} failed, "
+              f"{stats['skipped']} already done")
+
+    except Exception as e:
+        raise Exception(f"❌ An error occurred while running the batch: {e}")
+
+def monitor():
+    """
+    Incrementally re-check a list of URLs, re-verifying only changed paragraphs.
+    Usage: monitor <urls.txt> [output.jsonl]
+    """
+    try:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            results = monitor_urls(f)
+        out = open(sys.argv[2], "a", encoding="utf-8") if len(sys.argv) > 2 else None
+        for url, result in results.items():
+            print(f"{url}: {result.overall_verdict.value} — {result.note}")
+            if out:
+                out.write(json.dumps({"url": url, "verdict": result.overall_verdict.value,
+                                      "result": result.model_dump(mode="json")}, ensure_ascii=False) + "\n")
+        if out:
+            out.close()
+
+    except Exception as e:
+        raise Exception(f"❌ An error occurred while monitoring: {e}")
+
 # Optional: call one of them directly if needed
 if __name__ == "__main__":
     run()  # or train(), test(), replay() depending on use case
@@ -0,0 +1,89 @@
+import re
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from . import settings
+from .chunking import split_into_chunks
+from .parallel_verify import cancel_check, run_bounded, split_claims, verify_claims
+from .progress import TASK_FINISHED, TASK_STARTED, ProgressEvent
+from .results import ClaimResult, FactCheckResult
+from .verdict_cache import normalize_input
+
+
+def _shingles(text: str, size: int = 3) -> set:
+    words = re.findall(r"\w+", normalize_input(text))
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def dedupe_claims(claims: List[Tuple[str, str]],
+                  threshold: float = settings.CLAIM_DEDUPE_THRESHOLD) -> List[Tuple[str, str]]:
+    """Drop (claim, source chunk) pairs whose claim repeats an earlier one (shingle Jaccard)"""
+    kept, signatures = [], []
+    for claim, chunk in claims:
+        signature = _shingles(claim)
+        if any(len(signature & other) / len(signature | other) >= threshold for other in signatures):
+            continue
+        kept.append((claim, chunk))
+        signatures.append(signature)
+    return kept
+
+
+def extract_claims_chunked(input_content: str, checker_factory: Callable,
+                           max_workers: int = settings.VERIFY_CONCURRENCY,
+                           chunk_timeout: float = settings.CLAIM_TIMEOUT
+                           ) -> Tuple[List[Tuple[str, str]], List[ClaimResult]]:
+    """
+    Map: extract claims from each chunk in parallel. Reduce: merge and deduplicate them.
+    A chunk whose crew fails or runs past chunk_timeout doesn't sink the others; it is
+    returned as a failed ClaimResult alongside the (claim, source chunk) pairs.
+    """
+    chunks = split_into_chunks(input_content)
+
+    def extract(index: int, chunk: str, cancelled: threading.Event) -> List[Tuple[str, str]]:
+        crew = checker_factory().claim_extraction_crew()
+        crew.step_callback = cancel_check(cancelled)
+        output = crew.kickoff(inputs={"input_content": chunk})
+        return [(claim, chunk) for claim in split_claims(str(output))]
+
+    failures = {}
+
+    def failed(index: int, message: str, elapsed: float) -> list:
+        excerpt = " ".join(chunks[index].split())[:80]
+        failures[index] = ClaimResult.failed(f"Claims in section {index + 1} of {len(chunks)} (\"{excerpt}…\")",
+                                             f"Claim extraction {message}", elapsed)
+        return []
+
+    per_chunk = run_bounded(chunks, extract, max_workers, chunk_timeout, failed, thread_name_prefix="claim-extract")
+    return dedupe_claims([pair for pairs in per_chunk for pair in pairs]), [failures[i] for i in sorted(failures)]
+
+def run_chunked_fact_check(input_content: str, checker_factory: Callable = None,
+                           max_workers: int = settings.VERIFY_CONCURRENCY,
+                           claim_timeout: float = settings.CLAIM_TIMEOUT,
+                           on_event: Optional[Callable] = None) -> FactCheckResult:
+    """Fact-check a document too large for one prompt by map-reducing claim extraction over chunks"""
+    if checker_factory is None:
+        from .crew import create_fact_checker
+        checker_factory = create_fact_checker
+
+    started = time.monotonic()
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_STARTED, "content_analysis_task",
+                               detail=f"{len(input_content):,} characters in chunks"))
+    pairs, failures = extract_claims_chunked(input_content, checker_factory, max_workers, claim_timeout)
+    claims = [claim for claim, _ in pairs]
+    if on_event is not None:
+        listing = "\n".join(f"{number}. {claim}" for number, claim in enumerate(claims, start=1))
+        on_event(ProgressEvent(TASK_FINISHED, "content_analysis_task", output=listing))
+        on_event(ProgressEvent(TASK_STARTED, "verification_task", detail=f"{len(claims)} claim(s)"))
+
+    # Each claim is verified against the chunk it came from rather than the whole document
+    contexts = [chunk for _, chunk in pairs]
+    results = verify_claims(claims, contexts, checker_factory, max_workers, claim_timeout, on_event)
+    # Failed sections stay in the report so the check is marked incomplete rather than silently partial
+    result = FactCheckResult(claims=results + failures, elapsed_seconds=round(time.monotonic() - started, 3))
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_FINISHED, "verification_task", output=result.to_markdown()))
+    return result
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from . import settings
+from .claim_index import get_claim_index
+from .parallel_verify import cancel_check, run_bounded, split_claims, verify_claims
+from .progress import TASK_FINISHED, TASK_STARTED, ProgressEvent
+from .results import ClaimResult, FactCheckResult
+from .verdict_cache import normalize_input
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Cleaned page text (one block per line) as a list of non-empty paragraphs"""
+    return [paragraph.strip() for paragraph in re.split(r"\n+", text) if paragraph.strip()]
+
+
+def paragraph_hash(paragraph: str) -> str:
+    return hashlib.sha256(normalize_input(paragraph).encode("utf-8")).hexdigest()[:32]
+
+
+def changed_sections(paragraphs: List[str], known: set) -> List[List[int]]:
+    """Runs of consecutive paragraphs whose hash was not seen in the previous snapshot"""
+    sections, current = [], []
+    for position, paragraph in enumerate(paragraphs):
+        if paragraph_hash(paragraph) in known:
+            if current:
+                sections.append(current)
+                current = []
+        else:
+            current.append(position)
+    if current:
+        sections.append(current)
+    return sections
+
+
+def bounded_sections(sections: List[List[int]], paragraphs: List[str],
+                     max_chars: int = settings.DOCUMENT_CHUNK_CHARS) -> List[List[int]]:
+    """
+    Split runs of changed paragraphs into pieces of at most max_chars, so a first
+    check (where every paragraph is new) or a large rewrite is extracted in
+    chunk-sized crews instead of one prompt holding the whole page.
+    """
+    bounded = []
+    for section in sections:
+        current, size = [], 0
+        for position in section:
+            length = len(paragraphs[position])
+            if current and size + length > max_chars:
+                bounded.append(current)
+                current, size = [], 0
+            current.append(position)
+            size += length
+        bounded.append(current)
+    return bounded
+
+
+def _source_paragraph(claim: str, section: List[int], paragraphs: List[str]) -> int:
+    """Position of the paragraph in a section sharing the most words with the claim"""
+    def words(text: str) -> set:
+        return set(re.findall(r"\w+", normalize_input(text)))
+
+    claim_words = words(claim)
+    return max(section, key=lambda position: len(claim_words & words(paragraphs[position])))
+
+
+class PageSnapshots:
+    """Last verified version of each monitored page: paragraph hashes and the verdicts they produced"""
+
+    def __init__(self, path=None):
+        self.path = path or settings.CACHE_DIR / "snapshots.sqlite3"
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS page_snapshots ("
+            " url TEXT PRIMARY KEY,"
+            " paragraphs TEXT NOT NULL,"
+            " checked_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, List[ClaimResult]]]:
+        """Paragraph hash -> verified claims from the previous check (None if never checked)"""
+        with self._lock:
+            row = self._conn.execute("SELECT paragraphs FROM page_snapshots WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return {digest: [ClaimResult.model_validate(claim) for claim in claims]
+                for digest, claims in json.loads(row[0]).items()}
+
+    def set(self, url: str, paragraphs: Dict[str, List[ClaimResult]]) -> None:
+        payload = json.dumps({digest: [claim.model_dump(mode="json") for claim in claims]
+                              for digest, claims in paragraphs.items()})
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_snapshots (url, paragraphs, checked_at) VALUES (?, ?, ?)",
+                (url, payload, time.time()),
+            )
+            self._conn.commit()
+
+
+def recheck_page(url: str, checker_factory: Callable = None, snapshots: PageSnapshots = None,
+                 max_workers: int = settings.VERIFY_CONCURRENCY,
+                 claim_timeout: float = settings.CLAIM_TIMEOUT,
+                 on_event: Optional[Callable] = None) -> FactCheckResult:
+    """
+    Re-verify a previously checked page, paying only for what changed: claims
+    are extracted from new or edited paragraphs, verified (or matched against
+    the claim index), and verdicts for unchanged paragraphs are reused. The
+    first check of a URL takes the whole page in DOCUMENT_CHUNK_CHARS sections.
+    """
+    from .fetch import get_fetcher
+    if checker_factory is None:
+        from .crew import create_fact_checker
+        checker_factory = create_fact_checker
+    snapshots = snapshots or get_page_snapshots()
+
+    started = time.monotonic()
+    paragraphs = split_paragraphs(get_fetcher().fetch_text(url, revalidate=True))
+    previous = snapshots.get(url)
+    first_check = previous is None
+    previous = previous or {}
+    sections = bounded_sections(changed_sections(paragraphs, set(previous)), paragraphs)
+    if on_event is not None:
+        changed = sum(len(section) for section in sections)
+        on_event(ProgressEvent(TASK_STARTED, "content_analysis_task",
+                               detail=f"{changed} of {len(paragraphs)} paragraph(s) changed"))
+
+    extraction_errors = {}
+
+    def extract(index: int, section: List[int], cancelled: threading.Event) -> List[str]:
+        text = "\n\n".join(paragraphs[position] for position in section)
+        crew = checker_factory().claim_extraction_crew()
+        crew.step_callback = cancel_check(cancelled)
+        return split_claims(str(crew.kickoff(inputs={"input_content": text})))
+
+    def failed(index: int, message: str, elapsed: float) -> List[str]:
+        # One failed or hung section doesn't sink the rest; it stays out of the snapshot and is retried next time
+        excerpt = " ".join(" ".join(paragraphs[position] for position in sections[index]).split())[:80]
+        extraction_errors[index] = ClaimResult.failed(f"Claims in \"{excerpt}…\"", f"Claim extraction {message}",
+                                                      elapsed)
+        return []
+
+    extracted = run_bounded(sections, extract, max_workers, claim_timeout, failed, thread_name_prefix="page-recheck")
+
+    # Restated claims (e.g. a paragraph that only moved or was reworded) reuse indexed verdicts
+    claim_index = get_claim_index()
+    matched, to_verify, contexts = {}, [], []
+    for section, claims in zip(sections, extracted):
+        for claim in claims:
+            match = claim_index.lookup(claim)
+            if match is not None:
+                matched[claim] = match.result.model_copy(update={"claim": claim})
+            elif claim not in to_verify:
+                to_verify.append(claim)
+                contexts.append(f"Source: {url}\n\n" + "\n\n".join(paragraphs[position] for position in section))
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_FINISHED, "content_analysis_task",
+                               output="\n".join(f"- {claim}" for claims in extracted for claim in claims)))
+        on_event(ProgressEvent(TASK_STARTED, "verification_task", detail=f"{len(to_verify)} new claim(s)"))
+    verified = dict(zip(to_verify, verify_claims(to_verify, contexts, checker_factory,
+                                                 max_workers, claim_timeout, on_event)))
+    for result in verified.values():
+        claim_index.add(result)
+
+    # Attach each new verdict to the paragraph it came from, so later edits elsewhere keep it
+    owned, failed = {}, set(extraction_errors)
+    for index, (section, section_claims) in enumerate(zip(sections, extracted)):
+        for claim in section_claims:
+            result = verified.get(claim) or matched[claim]
+            owned.setdefault(_source_paragraph(claim, section, paragraphs), []).append(result)
+            if result.error:
+                failed.add(index)
+
+    snapshot, claims, reused = {}, [], len(matched)
+    section_of = {position: index for index, section in enumerate(sections) for position in section}
+    for position, paragraph in enumerate(paragraphs):
+        digest = paragraph_hash(paragraph)
+        if position in section_of:
+            results = owned.get(position, [])
+            # Sections with a failed claim are left out of the snapshot so they are retried next time
+            if section_of[position] not in failed:
+                snapshot[digest] = results
+        else:
+            results = snapshot[digest] = previous[digest]
+            reused += len(results)
+        claims.extend(results)
+    snapshots.set(url, snapshot)
+
+    unique = list({claim.claim: claim for claim in claims}.values())
+    unique += [extraction_errors[index] for index in sorted(extraction_errors)]
+    changed = sum(len(section) for section in sections)
+    if first_check:
+        note = (f"First check: {len(paragraphs)} paragraph(s) in {len(sections)} section(s), "
+                f"{len(verified)} claim(s) verified, {reused} matched from earlier checks.")
+    else:
+        note = (f"Incremental re-check: {changed} of {len(paragraphs)} paragraph(s) changed, "
+                f"{len(verified)} claim(s) verified, {reused} prior verdict(s) reused.")
+    result = FactCheckResult(claims=unique, elapsed_seconds=round(time.monotonic() - started, 3), note=note)
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_FINISHED, "verification_task", output=result.to_markdown()))
+    return result
+
+
+def monitor_urls(urls: Iterable[str], checker_factory: Callable = None) -> Dict[str, FactCheckResult]:
+    """Incrementally re-check each URL in turn; failures are reported per URL"""
+    results = {}
+    for url in urls:
+        url = url.strip()
+        if not url or url.startswith("#"):
+            continue
+        try:
+            results[url] = recheck_page(url, checker_factory)
+        except Exception as e:
+            results[url] = FactCheckResult(claims=[ClaimResult.failed(url, f"Re-check failed: {e}")])
+    return results
+
+
+_snapshots = None
+_snapshots_lock = threading.Lock()
+
+
+def get_page_snapshots() -> PageSnapshots:
+    """Process-wide page snapshot store"""
+    global _snapshots
+    with _snapshots_lock:
+        if _snapshots is None:
+            _snapshots = PageSnapshots()
+        return _snapshots
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from . import settings
+from .results import URL_PATTERN, ClaimVerdict, Verdict, VerificationReport
+from .search import SearchCache, configure_search
+from .transcripts import extract_video_id
+
+AGENTS = ("fact_researcher", "content_analyzer", "fact_verifier")
+LLM_LATENCY = float(os.getenv("SATYAGYAN_BENCH_LLM_LATENCY", 0.02))
+NETWORK_LATENCY = float(os.getenv("SATYAGYAN_BENCH_NETWORK_LATENCY", 0.01))
+
+# Recorded inputs replayed instead of the network
+RECORDED_PAGES = {
+    "https://news.example.com/2024/city-budget": """
+        <html><head><title>City approves 2024 budget</title><script>track()</script></head>
+        <body><nav>Home | World | Politics | Sports</nav>
+        <article><h1>City approves 2024 budget</h1>
+        <p>The city council approved a budget of 4.2 billion dollars on 12 March 2024.</p>
+        <p>Spending on public transport rises by 15 percent compared with 2023.</p>
+        <p>The mayor said the plan adds 1,200 teachers over the next 3 years.</p></article>
+        <footer>Subscribe | Privacy | Cookies</footer></body></html>""",
+}
+RECORDED_TRANSCRIPTS = {
+    "dQw4w9WgXcQ": "In this video we look at the moon landing. Apollo 11 landed on the moon in 1969. "
+                   "Neil Armstrong walked on the surface for about 2 hours. "
+                   "Some people claim the footage was filmed in a studio in 1968.",
+}
+DOCUMENT_PARAGRAPH = ("Section {n}. The national statistics office reported that unemployment fell to "
+                      "{rate}.{n} percent in {year}. Exports grew by {growth} percent during the same period, "
+                      "while the central bank kept its policy rate unchanged for {months} months.")
+
+CASES = {
+    "text": "The Eiffel Tower was completed in 1889 and is 330 metres tall.",
+    "url": "https://news.example.com/2024/city-budget",
+    "youtube": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    # Large enough to take the chunked map-reduce path
+    "document": "\n\n".join(DOCUMENT_PARAGRAPH.format(n=n, rate=3 + n % 5, year=2000 + n % 24,
+                                                      growth=n % 9 + 1, months=n % 12 + 1)
+                            for n in range(1, 121)),
+}
+
+
+def _checksum(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def _factual_sentences(text: str, limit: int = 3):
+    """Sentences containing a number: a deterministic stand-in for claim extraction"""
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    found = []
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if re.search(r"\d", sentence) and 6 <= len(sentence.split()) <= 40 and sentence not in found:
+            found.append(sentence)
+        if len(found) == limit:
+            break
+    return found
+
+
+def _fake_verdict(claim: str) -> ClaimVerdict:
+    checksum = _checksum(claim)
+    verdict = (Verdict.TRUE, Verdict.FALSE, Verdict.PARTIALLY_TRUE)[checksum % 3]
+    return ClaimVerdict(claim=claim, verdict=verdict, confidence=0.6 + (checksum % 4) / 10,
+                       evidence_urls=[f"https://evidence.example.org/{checksum % 1000}"],
+                       explanation="Deterministic offline verdict.")
+
+
+def _fake_llm_class():
+    from crewai import BaseLLM
+
+    class FakeLLM(BaseLLM):
+        """
+        Deterministic LLM for one agent role: calls its most relevant tool once
+        (ReAct text format), then answers from the observation and its inputs.
+        """
+
+        def __init__(self, agent: str, latency: float = LLM_LATENCY):
+            super().__init__(model=f"offline-fake/{agent}")
+            self.agent = agent
+            self.latency = latency
+
+        def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+            time.sleep(self.latency)
+            if isinstance(messages, str):
+                messages = [{"role": "user", "content": messages}]
+            text = "\n".join(str(message.get("content", "")) for message in messages)
+            return getattr(self, "_" + self.agent)(text)
+
+        def supports_function_calling(self) -> bool:
+            return False
+
+        def supports_stop_words(self) -> bool:
+            return True
+
+        def get_context_window_size(self) -> int:
+            return 128000
+
+        @staticmethod
+        def _tool(text: str, keyword: str):
+            return next((name.strip() for name in re.findall(r"Tool Name: (.+)", text)
+                         if keyword in name.lower()), None)
+
+        def _act_or_answer(self, text: str, keyword: str, arguments: dict, answer):
+            tool = self._tool(text, keyword)
+            if tool and "Observation:" not in text:
+                return (f"Thought: I should use {tool}.\nAction: {tool}\n"
+                        f"Action Input: {json.dumps(arguments)}")
+            return f"Thought: I now know the final answer\nFinal Answer: {answer()}"
+
+        def _fact_researcher(self, text: str) -> str:
+            urls = URL_PATTERN.findall(text)
+            def answer():
+                observed = text.split("Observation:")[-1] if "Observation:" in text else text
+                return "Research summary:\n" + observed.strip()[:1500]
+            if urls and extract_video_id(urls[0]):
+                return self._act_or_answer(text, "youtube", {"url": urls[0]}, answer)
+            if urls:
+                return self._act_or_answer(text, "scrap", {"url": urls[0]}, answer)
+            query = (_factual_sentences(text, 1) or ["fact check"])[0]
+            return self._act_or_answer(text, "search", {"search_query": query}, answer)
+
+        def _content_analyzer(self, text: str) -> str:
+            claims = _factual_sentences(text) or ["The content makes no checkable factual claims."]
+            return f"Thought: I now know the final answer\nFinal Answer: {json.dumps({'claims': claims})}"
+
+        def _fact_verifier(self, text: str) -> str:
+            match = re.search(r"^Claim: (.+)$", text, re.MULTILINE)
+            claims = [match.group(1).strip()] if match else _factual_sentences(text)
+
+            def answer():
+                if match:
+                    return _fake_verdict(claims[0]).model_dump_json()
+                return VerificationReport(claims=[_fake_verdict(claim) for claim in claims]).model_dump_json()
+            return self._act_or_answer(text, "search", {"search_query": claims[0] if claims else "fact"}, answer)
+
+    return FakeLLM
+
+
+class RecordedResponse:
+    def __init__(self, url: str, status_code: int, text: str = ""):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = {"ETag": f'"{_checksum(text)}"'} if text else {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+
+class RecordedSession:
+    """Stands in for the fetcher's requests.Session, replaying RECORDED_PAGES"""
+
+    def __init__(self, pages: dict, latency: float = NETWORK_LATENCY):
+        self.pages = pages
+        self.latency = latency
+        self.requests = 0
+
+    def get(self, url: str, headers: dict = None, timeout=None) -> RecordedResponse:
+        time.sleep(self.latency)
+        self.requests += 1
+        if url not in self.pages:
+            return RecordedResponse(url, 404)
+        response = RecordedResponse(url, 200, self.pages[url])
+        if (headers or {}).get("If-None-Match") == response.headers["ETag"]:
+            return RecordedResponse(url, 304)
+        return response
+
+
+def fake_search(query: str) -> dict:
+    time.sleep(NETWORK_LATENCY)
+    checksum = _checksum(query)
+    return {"organic": [{"title": f"Source {n} on {query[:60]}",
+                         "link": f"https://evidence.example.org/{(checksum + n) % 1000}",
+                         "snippet": f"Independent reporting relevant to: {query[:120]}"} for n in range(3)]}
+
+
+def install_offline_backends(cache_dir: Path) -> None:
+    """Point search, page fetching and transcripts at the recorded fakes with private caches"""
+    from .fetch import configure_fetcher
+    from .transcripts import configure_transcript_store
+
+    configure_search(backend=fake_search, cache=SearchCache(":memory:"))
+    fetcher = configure_fetcher(cache_dir=cache_dir / "pages")
+    fetcher.session = RecordedSession(RECORDED_PAGES)
+
+    def download(video_id: str) -> str:
+        time.sleep(NETWORK_LATENCY)
+        return RECORDED_TRANSCRIPTS[video_id]
+    configure_transcript_store(cache_dir=cache_dir / "transcripts", downloader=download)
+
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def measure_setup(llms: dict, repeats: int) -> dict:
+    """Cold crew import + YAML parse, then the per-run cost of building a crew from the template"""
+    start = time.perf_counter()
+    from .crew import create_fact_checker
+    create_fact_checker(llms).analysis_crew()
+    cold = time.perf_counter() - start
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        create_fact_checker(llms).analysis_crew()
+        samples.append(time.perf_counter() - start)
+    return {"cold_seconds": cold, "per_run_median_seconds": statistics.median(samples)}
+
+
+def run_case(content: str, checker_factory, repeats: int, concurrency: int) -> dict:
+    """Run one input repeatedly (concurrency at a time) and summarize latency, throughput and memory"""
+    from .pipeline import execute
+
+    def one(_):
+        start = time.perf_counter()
+        result = execute(content, checker_factory=checker_factory)
+        return time.perf_counter() - start, result
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        runs = list(executor.map(one, range(repeats)))
+    wall = time.perf_counter() - start
+    latencies = [latency for latency, _ in runs]
+    return {
+        "checks": repeats,
+        "throughput_per_second": repeats / wall if wall else 0.0,
+        "p50_seconds": statistics.median(latencies),
+        "p95_seconds": _percentile(latencies, 0.95),
+        "peak_memory_bytes": tracemalloc.get_traced_memory()[1],
+        "claims": sum(len(result.claims) for _, result in runs),
+        "failed_claims": sum(1 for _, result in runs for claim in result.claims if claim.error),
+    }
+
+
+def main():
+    """
+    Run the fact-check pipeline end to end against a deterministic fake LLM,
+    fake search and recorded pages/transcripts — no network or API keys needed.
+    Usage: offline_benchmark [repeats] [concurrency] [output.json]
+    """
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    # The search tool is only attached when a key is configured; the fake backend ignores it
+    os.environ.setdefault("SERPER_API_KEY", "offline-benchmark")
+    # Measure the pipeline itself, not the outbound rate limits
+    for provider in settings.RATE_LIMITS:
+        settings.RATE_LIMITS[provider] = (0, 1)
+    FakeLLM = _fake_llm_class()
+    llms = {name: FakeLLM(name) for name in AGENTS}
+
+    with tempfile.TemporaryDirectory(prefix="satyagyan-bench-") as cache_dir:
+        install_offline_backends(Path(cache_dir))
+        from .crew import create_fact_checker
+
+        tracemalloc.start()
+        report = {"settings": {"repeats": repeats, "concurrency": concurrency, "llm_latency": LLM_LATENCY,
+                               "network_latency": NETWORK_LATENCY, "parallel_verify": settings.PARALLEL_VERIFY},
+                  "setup": measure_setup(llms, repeats), "cases": {}}
+        for name, content in CASES.items():
+            report["cases"][name] = run_case(content, lambda: create_fact_checker(llms), repeats, concurrency)
+        tracemalloc.stop()
+
+    setup = report["setup"]
+    print(f"\nsetup: cold {setup['cold_seconds'] * 1000:.1f} ms, "
+          f"per run {setup['per_run_median_seconds'] * 1000:.2f} ms")
+    print(f"\n{'case':<10} {'checks/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'peak MiB':>9} {'claims':>7} {'failed':>7}")
+    for name, case in report["cases"].items():
+        print(f"{name:<10} {case['throughput_per_second']:9.2f} {case['p50_seconds'] * 1000:9.1f} "
+              f"{case['p95_seconds'] * 1000:9.1f} {case['peak_memory_bytes'] / 2 ** 20:9.1f} "
+              f"{case['claims']:7d} {case['failed_claims']:7d}")
+
+    if len(sys.argv) > 3:
+        with open(sys.argv[3], "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import json
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Sequence, Union
+
+from . import settings
+from .compaction import compact_contexts
+from .progress import (CLAIM_VERIFIED, TASK_FINISHED, TASK_STARTED, CrewProgress,
+                       ProgressEvent, total_tokens)
+from .results import ClaimResult, ClaimVerdict, FactCheckResult
+from .tracing import propagate
+
+BULLET_PATTERN = re.compile(r"^\s*(?:\d+[.)]|[-*•]|claim\s*\d+\s*[:.)-])\s+(.*\S)", re.IGNORECASE)
+
+
+def _json_claims(text: str) -> Optional[List[str]]:
+    """Parse the {"claims": [...]} format described for the content analyzer"""
+    match = re.search(r"\{.*\}|\[.*\]", text, re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return None
+    items = data.get("claims", []) if isinstance(data, dict) else data
+    claims = []
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get("text") or item.get("claim")
+        if isinstance(item, str) and item.strip():
+            claims.append(item.strip())
+    return claims or None
+
+
+def split_claims(analysis_text: str) -> List[str]:
+    """Split content_analysis_task output into independent claims"""
+    claims = _json_claims(analysis_text)
+    if claims:
+        return claims
+    claims = []
+    for line in analysis_text.splitlines():
+        match = BULLET_PATTERN.match(line)
+        if match:
+            claims.append(match.group(1).strip("*_ "))
+    return claims or ([analysis_text.strip()] if analysis_text.strip() else [])
+
+
+class VerificationCancelled(Exception):
+    """Raised from a crew's step callback once its claim has timed out"""
+
+
+def cancel_check(cancelled: threading.Event) -> Callable:
+    """crewai step callback that stops a crew at its next step once cancelled is set"""
+    def check(step) -> None:
+        if cancelled.is_set():
+            raise VerificationCancelled("cancelled after timing out")
+    return check
+
+
+def run_bounded(items: Sequence, work: Callable, max_workers: int, timeout: float,
+                on_failure: Callable, thread_name_prefix: str = "bounded") -> list:
+    """
+    Run work(index, item, cancelled) for every item on a pool of max_workers
+    threads and return the results in order. An item that raises, runs longer
+    than timeout, or is still waiting when the whole batch's deadline passes
+    gets on_failure(index, message, elapsed_seconds) as its result instead,
+    where message reads "failed: ..." or "timed out after ...s".
+
+    The timeout is best-effort: cancelled is set for a timed-out item, which
+    work passes to its crew as cancel_check(cancelled) so the crew stops at its
+    next step, but an LLM or tool call already in flight runs to completion in
+    the background.
+    """
+    started = {}
+    cancelled = [threading.Event() for _ in items]
+
+    def run(index: int, item):
+        if cancelled[index].is_set():
+            raise VerificationCancelled("cancelled before it started")
+        started[index] = time.monotonic()
+        return work(index, item, cancelled[index])
+
+    results = [None] * len(items)
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=thread_name_prefix)
+    futures = {executor.submit(propagate(run), index, item): index for index, item in enumerate(items)}
+    pending = set(futures)
+    # Queued items can be starved by stuck crews, so bound the whole batch too
+    rounds = -(-len(items) // max(1, max_workers))
+    deadline = time.monotonic() + timeout * (rounds + 1)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    elapsed = round(time.monotonic() - started[index], 3) if index in started else 0.0
+                    results[index] = on_failure(index, f"failed: {e}", elapsed)
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                if (index in started and now - started[index] > timeout) or now > deadline:
+                    results[index] = on_failure(index, f"timed out after {timeout:.0f}s", timeout)
+                    cancelled[index].set()
+                    pending.discard(future)
+    finally:
+        # Running crews can't be interrupted mid-call; they stop at their next step
+        for event in cancelled:
+            event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def verify_claims(claims: List[str], research: Union[str, List[str]], checker_factory: Callable,
+                  max_workers: int = settings.VERIFY_CONCURRENCY,
+                  claim_timeout: float = settings.CLAIM_TIMEOUT,
+                  on_event: Optional[Callable] = None) -> List[ClaimResult]:
+    """
+    Verify claims concurrently on a bounded pool, each with its own
+    (best-effort, see run_bounded) timeout. research is either one context
+    shared by all claims or one context per claim; a shared context is always
+    cut down to each claim's excerpts rather than copied whole into every crew.
+    """
+    contexts = [research] * len(claims) if isinstance(research, str) else research
+    if settings.CONTEXT_COMPACTION or isinstance(research, str):
+        contexts, _ = compact_contexts(claims, contexts)
+
+    def verify(index: int, claim: str, cancelled: threading.Event) -> ClaimResult:
+        started = time.monotonic()
+        crew = checker_factory().claim_verification_crew()
+        crew.step_callback = cancel_check(cancelled)
+        inputs = {"input_content": f"Claim: {claim}\n\nResearch context:\n{contexts[index]}"}
+        output = crew.kickoff(inputs=inputs)
+        elapsed = round(time.monotonic() - started, 3)
+        result = getattr(output, "pydantic", None)
+        if isinstance(result, ClaimVerdict):
+            result = ClaimResult.from_verdict(result, claim, elapsed)
+        else:
+            result = ClaimResult.from_text(claim, str(output), elapsed)
+        if on_event is not None:
+            on_event(ProgressEvent(CLAIM_VERIFIED, "verification_task",
+                                   detail=f"Claim {index + 1}/{len(claims)}: {claim[:120]}",
+                                   output=result.to_markdown(), tokens=total_tokens(crew), claim=claim))
+        return result
+
+    def failed(index: int, message: str, elapsed: float) -> ClaimResult:
+        return ClaimResult.failed(claims[index], f"Verification {message}", elapsed)
+
+    return run_bounded(claims, verify, max_workers, claim_timeout, failed, thread_name_prefix="claim-verify")
+
+
+def run_parallel_fact_check(input_content: str, checker_factory: Callable = None,
+                            max_workers: int = settings.VERIFY_CONCURRENCY,
+                            claim_timeout: float = settings.CLAIM_TIMEOUT,
+                            on_event: Optional[Callable] = None) -> FactCheckResult:
+    """Research and analyze once, then verify the extracted claims in parallel"""
+    if checker_factory is None:
+        from .crew import create_fact_checker
+        checker_factory = create_fact_checker
+
+    started = time.monotonic()
+    crew = checker_factory().analysis_crew()
+    if on_event is not None:
+        CrewProgress(crew, on_event).attach()
+    output = crew.kickoff(inputs={"input_content": input_content})
+    research, analysis = (task_output.raw for task_output in output.tasks_output[:2])
+    claims = split_claims(analysis)
+
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_STARTED, "verification_task", detail=f"{len(claims)} claim(s)"))
+    results = verify_claims(claims, research, checker_factory, max_workers, claim_timeout, on_event)
+    result = FactCheckResult(claims=results, elapsed_seconds=round(time.monotonic() - started, 3))
+    if on_event is not None:
+        on_event(ProgressEvent(TASK_FINISHED, "verification_task", output=result.to_markdown()))
+    return result
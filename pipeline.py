@@ -0,0 +1,112 @@
+from typing import Callable, Optional
+
+from . import routing, settings
+from .claim_index import get_claim_index, is_indexable
+from .progress import CrewProgress
+from .results import ClaimResult, FactCheckResult, VerificationReport
+from .singleflight import SingleFlight
+from .tracing import annotate, span, trace
+from .verdict_cache import cache_key, get_verdict_cache
+
+_in_flight = SingleFlight()
+
+
+def _cached_result(input_content: str, route: Optional[str]) -> Optional[FactCheckResult]:
+    cached = get_verdict_cache().get(input_content, route)
+    if cached is None:
+        return None
+    try:
+        return FactCheckResult.model_validate_json(cached)
+    except ValueError:
+        # Entry written by an older, free-text version of the pipeline
+        return None
+
+
+def _run_full_crew(input_content: str, on_event: Optional[Callable],
+                   checker_factory: Callable) -> FactCheckResult:
+    crew = checker_factory().crew()
+    if on_event is not None:
+        CrewProgress(crew, on_event).attach()
+    output = crew.kickoff(inputs={"input_content": input_content})
+    report = getattr(output, "pydantic", None)
+    if isinstance(report, VerificationReport):
+        return FactCheckResult(claims=[ClaimResult.from_verdict(claim) for claim in report.claims])
+    return FactCheckResult(claims=[ClaimResult.from_text(input_content[:300], str(output))])
+
+
+def execute(input_content: str, on_event: Optional[Callable] = None,
+            checker_factory: Callable = None, input_type: Optional[str] = None) -> FactCheckResult:
+    """
+    Run the crews for one input without consulting or filling any cache.
+    With adaptive routing, short claims go straight to the verifier and links
+    are fetched directly instead of through the research agent.
+    """
+    if checker_factory is None:
+        from .crew import create_fact_checker
+        checker_factory = create_fact_checker
+
+    if settings.ADAPTIVE_ROUTING:
+        input_type = routing.classify_input(input_content, input_type)
+        annotate(input_type=input_type)
+        if input_type == routing.CLAIM:
+            return routing.run_direct_verification(input_content, checker_factory, on_event=on_event)
+        if input_type in (routing.URL, routing.YOUTUBE):
+            url = input_content.strip()
+            content = routing.fetch_source(url, input_type)
+            if content is not None:
+                return routing.run_source_fact_check(url, content, checker_factory, on_event=on_event)
+            # Unreachable or empty source: let the research agent try its own tools
+
+    if len(input_content) > settings.CHUNKED_ANALYSIS_THRESHOLD:
+        from .mapreduce import run_chunked_fact_check
+        return run_chunked_fact_check(input_content, checker_factory, on_event=on_event)
+    if settings.PARALLEL_VERIFY or settings.CONTEXT_COMPACTION:
+        from .parallel_verify import run_parallel_fact_check
+        # Compaction needs the extracted claims before verification, so it always takes the split path
+        workers = settings.VERIFY_CONCURRENCY if settings.PARALLEL_VERIFY else 1
+        return run_parallel_fact_check(input_content, checker_factory, max_workers=workers, on_event=on_event)
+    return _run_full_crew(input_content, on_event, checker_factory)
+
+
+def run_fact_check(input_content: str, on_event: Optional[Callable] = None,
+                   input_type: Optional[str] = None) -> FactCheckResult:
+    """
+    Run a full fact check, serving repeat inputs from the verdict cache and
+    near-duplicate claims from the claim index before starting a crew.
+    on_event receives a progress.ProgressEvent for every task start, tool call and finish.
+    input_type is an optional routing.* hint (the mode picked in the UI).
+    Every run is traced (see tracing.py); callers can wrap it in their own trace to read the breakdown.
+    """
+    route = routing.effective_type(input_content, input_type)
+    with trace("fact_check", input_bytes=len(input_content.encode("utf-8"))) as run:
+        on_event = run.chain(on_event)
+        with span("cache.verdict") as lookup:
+            result = _cached_result(input_content, route)
+            lookup.set(cache="hit" if result is not None else "miss")
+        if result is not None:
+            return result
+
+        claim_index = get_claim_index()
+        if is_indexable(input_content) and route != routing.DOCUMENT:
+            with span("cache.claim_index") as lookup:
+                match = claim_index.lookup(input_content)
+                lookup.set(cache="hit" if match is not None else "miss")
+            if match is not None:
+                return FactCheckResult(
+                    claims=[match.result],
+                    note=f"Matched a previously verified claim ({match.similarity:.0%} similar): \"{match.claim}\"",
+                )
+
+        def compute(emit: Callable) -> FactCheckResult:
+            result = execute(input_content, emit, input_type=input_type)
+            # Only fully verified results are reused; timeouts and failures are retried next time
+            if result.complete:
+                get_verdict_cache().set(input_content, result.model_dump_json(), route)
+                for claim in result.claims:
+                    claim_index.add(claim)
+                if is_indexable(input_content) and route != routing.DOCUMENT and len(result.claims) == 1:
+                    claim_index.add(result.claims[0], claim=input_content)
+            return result
+
+        # Identical submissions arriving while this input is being checked share one crew run
+        return _in_flight.run(cache_key(input_content, input_type=route), compute, on_event)
@@ -0,0 +1,82 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+TASK_STARTED = "task_started"
+TOOL_CALL = "tool_call"
+TASK_FINISHED = "task_finished"
+CLAIM_VERIFIED = "claim_verified"
+
+# Share of the progress bar reached when each task finishes
+TASK_PROGRESS = {
+    "research_task": 35,
+    "content_analysis_task": 60,
+    "verification_task": 100,
+}
+
+TASK_LABELS = {
+    "research_task": "Researching sources",
+    "content_analysis_task": "Extracting claims",
+    "verification_task": "Verifying claims",
+}
+
+
+@dataclass
+class ProgressEvent:
+    """A single progress update emitted while a crew runs"""
+    kind: str
+    task: str
+    detail: str = ""
+    output: Optional[str] = None
+    tokens: int = 0
+    claim: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+def total_tokens(crew) -> int:
+    """Tokens used by a crew so far, or 0 if this crewai version can't report them"""
+    try:
+        return int(crew.calculate_usage_metrics().total_tokens)
+    except Exception:
+        return 0
+
+
+class CrewProgress:
+    """Translates crewai step/task callbacks of one sequential crew into ProgressEvents"""
+
+    def __init__(self, crew, emit: Callable[[ProgressEvent], None]):
+        self.crew = crew
+        self.emit = emit
+        self.task_names = [getattr(task, "name", None) or f"task_{i}" for i, task in enumerate(crew.tasks)]
+        self.current = 0
+        self.tokens_seen = 0
+
+    def attach(self):
+        """Install the callbacks on the crew and announce the first task"""
+        self.crew.step_callback = self._on_step
+        self.crew.task_callback = self._on_task
+        if self.task_names:
+            self.emit(ProgressEvent(TASK_STARTED, self.task_names[0]))
+        return self.crew
+
+    def _task_name(self) -> str:
+        return self.task_names[min(self.current, len(self.task_names) - 1)]
+
+    def _on_step(self, step) -> None:
+        tool = getattr(step, "tool", None)
+        if tool:
+            detail = f"{tool}: {str(getattr(step, 'tool_input', ''))[:120]}"
+            self.emit(ProgressEvent(TOOL_CALL, self._task_name(), detail=detail))
+
+    def _on_task(self, task_output) -> None:
+        tokens = total_tokens(self.crew)
+        self.emit(ProgressEvent(
+            TASK_FINISHED,
+            self._task_name(),
+            output=getattr(task_output, "raw", str(task_output)),
+            tokens=max(0, tokens - self.tokens_seen),
+        ))
+        self.tokens_seen = tokens
+        self.current += 1
+        if self.current < len(self.task_names):
+            self.emit(ProgressEvent(TASK_STARTED, self.task_names[self.current]))
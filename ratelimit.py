@@ -0,0 +1,203 @@
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from . import settings
+from .tracing import annotate
+
+# Lower numbers are served first
+INTERACTIVE = 0
+BATCH = 10
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("satyagyan_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def priority(level: int):
+    """Run a block (and any crews it starts) at the given scheduling priority"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimited(Exception):
+    """A provider kept throttling or failing after every retry"""
+
+
+def _status(error: Exception) -> Optional[int]:
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) or getattr(error, "status_code", None)
+
+
+def is_retryable(error: Exception) -> bool:
+    """429s, 5xx, timeouts and provider rate-limit errors (e.g. litellm.RateLimitError)"""
+    if _status(error) in RETRYABLE_STATUS:
+        return True
+    name = type(error).__name__
+    return any(marker in name for marker in ("RateLimit", "Timeout", "ConnectionError", "ServiceUnavailable"))
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket for one provider. Callers queue by (priority, arrival), so
+    interactive requests overtake batch work; throttled calls are retried with
+    full-jitter exponential backoff until max_retries or max_elapsed runs out.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int,
+                 max_retries: int = settings.RATE_LIMIT_RETRIES,
+                 backoff: float = settings.RATE_LIMIT_BACKOFF,
+                 max_backoff: float = settings.RATE_LIMIT_MAX_BACKOFF,
+                 max_elapsed: float = settings.RATE_LIMIT_MAX_ELAPSED):
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self.counters = {"acquired": 0, "waited_seconds": 0.0, "max_queue_depth": 0,
+                         "retries": 0, "throttled": 0, "failures": 0}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, level: Optional[int] = None) -> float:
+        """Block until a token is available for this caller; returns the seconds spent waiting"""
+        if self.rate <= 0:
+            return 0.0
+        ticket = (_priority.get() if level is None else level, next(self._sequence))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            self.counters["max_queue_depth"] = max(self.counters["max_queue_depth"], len(self._waiting))
+            try:
+                while True:
+                    delay = None
+                    if self._waiting[0] == ticket:
+                        self._refill()
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            heapq.heappop(self._waiting)
+                            break
+                        delay = (1 - self._tokens) / self.rate
+                    self._cond.wait(delay)
+            except BaseException:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                raise
+            finally:
+                # Wake the next caller in line
+                self._cond.notify_all()
+            waited = time.monotonic() - started
+            self.counters["acquired"] += 1
+            self.counters["waited_seconds"] += waited
+        return waited
+
+    def call(self, func: Callable, *args, **kwargs):
+        """Call func under the rate limit, retrying throttled and transient failures"""
+        started = time.monotonic()
+        for attempt in range(self.max_retries + 1):
+            waited = self.acquire()
+            if waited > 0.01:
+                annotate(rate_limit_wait=round(waited, 3))
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                delay = _retry_after(e) or random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                elapsed = time.monotonic() - started
+                out_of_time = self.max_elapsed and elapsed + delay > self.max_elapsed
+                with self._cond:
+                    self.counters["throttled"] += _status(e) == 429 or "RateLimit" in type(e).__name__
+                    if attempt == self.max_retries or out_of_time:
+                        self.counters["failures"] += 1
+                        raise RateLimited(f"{self.name} still failing after {attempt + 1} attempts "
+                                          f"in {elapsed:.1f}s: {e}") from e
+                    self.counters["retries"] += 1
+                time.sleep(delay)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self.counters)
+            stats["queue_depth"] = len(self._waiting)
+        stats["waited_seconds"] = round(stats["waited_seconds"], 3)
+        return stats
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> RateLimiter:
+    """Process-wide limiter for llm, search, scrape or transcript calls"""
+    with _limiters_lock:
+        if provider not in _limiters:
+            rate, burst = settings.RATE_LIMITS.get(provider, (0, 1))
+            _limiters[provider] = RateLimiter(provider, rate, burst)
+        return _limiters[provider]
+
+
+def limiter_stats() -> dict:
+    """Queue depth, waits, retries and throttling counts for every provider used so far"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+class RateLimitedLLM:
+    """
+    Wraps an agent's LLM so its calls go through the shared llm limiter. Every
+    other attribute is read from the wrapped LLM, and isinstance checks see its
+    class, so crewai treats the wrapper like the LLM it was configured with.
+    """
+
+    _rate_limited = True
+
+    def __init__(self, llm):
+        object.__setattr__(self, "llm", llm)
+
+    @property
+    def __class__(self):
+        return type(self.llm)
+
+    def __getattr__(self, name: str):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.llm, name, value)
+
+    def call(self, *args, **kwargs):
+        return get_limiter("llm").call(self.llm.call, *args, **kwargs)
+
+
+def rate_limit_llm(llm):
+    """Return llm wrapped so its calls share the llm limiter (idempotent; the LLM itself is left untouched)"""
+    if llm is None or getattr(llm, "_rate_limited", False):
+        return llm
+    return RateLimitedLLM(llm)
@@ -0,0 +1,149 @@
+import re
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+
+URL_PATTERN = re.compile(r"https?://[^\s)\]>\"']+")
+
+
+class Verdict(str, Enum):
+    TRUE = "TRUE"
+    FALSE = "FALSE"
+    PARTIALLY_TRUE = "PARTIALLY_TRUE"
+    MISLEADING = "MISLEADING"
+    UNVERIFIED = "UNVERIFIED"
+
+
+# Phrases the verifier uses for each verdict, most specific first (breaks ties at the same position)
+VERDICT_PHRASES = [
+    (Verdict.PARTIALLY_TRUE, r"partially (?:true|accurate|correct)|mostly (?:true|accurate)|half[- ]true"),
+    (Verdict.MISLEADING, r"misleading"),
+    (Verdict.UNVERIFIED, r"unverifi(?:ed|able)|inconclusive|uncertain|insufficient evidence"),
+    (Verdict.FALSE, r"\bfalse\b|\bincorrect\b|\bdebunked\b|\bnot (?:true|accurate|correct)\b"),
+    (Verdict.TRUE, r"\btrue\b|\baccurate\b|\bcorrect\b"),
+]
+
+
+# "Verdict: FALSE", "**Verdict** - partially true": the label followed directly by a verdict
+VERDICT_TOKEN = re.compile(r"verdict\W*(TRUE|FALSE|PARTIALLY[ _]TRUE|MISLEADING|UNVERIFIED)\b", re.IGNORECASE)
+
+
+def parse_verdict(text: str) -> Verdict:
+    """
+    Verdict stated in free text: the token right after a 'verdict' label if
+    there is one, otherwise the earliest verdict phrase on the first line
+    mentioning a verdict (or in the whole text).
+    """
+    match = VERDICT_TOKEN.search(text)
+    if match:
+        return Verdict(re.sub(r"\s+", "_", match.group(1).upper()))
+    verdict_line = next((line for line in text.splitlines() if "verdict" in line.lower()), text)
+    hits = []
+    for rank, (candidate, pattern) in enumerate(VERDICT_PHRASES):
+        found = re.search(pattern, verdict_line, re.IGNORECASE)
+        if found:
+            # Earliest phrase wins, so later mentions ("...not misleading") don't override it
+            hits.append((found.start(), rank, candidate))
+    return min(hits)[2] if hits else Verdict.UNVERIFIED
+
+
+def extract_evidence(text: str) -> List[str]:
+    """Evidence URLs cited in free text, in order of first mention"""
+    return list(dict.fromkeys(url.rstrip(".,;") for url in URL_PATTERN.findall(text)))
+
+
+class ClaimVerdict(BaseModel):
+    """The verifier's output_pydantic schema: only the fields the LLM is asked to fill"""
+    claim: str = Field(description="The claim exactly as verified")
+    verdict: Verdict = Field(description="TRUE, FALSE, PARTIALLY_TRUE, MISLEADING or UNVERIFIED")
+    confidence: float = Field(default=0.5, ge=0.0, le=1.0, description="Confidence in the verdict, 0 to 1")
+    evidence_urls: List[str] = Field(default_factory=list, description="URLs of the sources relied on")
+    explanation: str = Field(default="", description="Short reasoning for the verdict")
+
+
+class ClaimResult(ClaimVerdict):
+    """Verification outcome of a single claim, with timing and failure set by the pipeline"""
+    elapsed_seconds: float = 0.0
+    error: str = ""
+
+    @classmethod
+    def from_verdict(cls, verdict: ClaimVerdict, claim: str = None, elapsed_seconds: float = 0.0) -> "ClaimResult":
+        """Result of a verdict parsed from the LLM; error and timing never come from the model"""
+        fields = verdict.model_dump(include=set(ClaimVerdict.model_fields))
+        if claim is not None:
+            fields["claim"] = claim
+        return cls(**fields, elapsed_seconds=elapsed_seconds)
+
+    @classmethod
+    def failed(cls, claim: str, error: str, elapsed_seconds: float = 0.0) -> "ClaimResult":
+        """Placeholder for a claim whose verification crashed or timed out"""
+        return cls(claim=claim, verdict=Verdict.UNVERIFIED, confidence=0.0, explanation=error,
+                   elapsed_seconds=elapsed_seconds, error=error)
+
+    @classmethod
+    def from_text(cls, claim: str, text: str, elapsed_seconds: float = 0.0) -> "ClaimResult":
+        """
+        Fallback when the LLM ignored the schema: take the verdict stated after
+        the 'verdict' label (see parse_verdict) instead of guessing from any mention.
+        """
+        return cls(claim=claim, verdict=parse_verdict(text), confidence=0.5, evidence_urls=extract_evidence(text),
+                   explanation=text.strip(), elapsed_seconds=elapsed_seconds)
+
+    def to_markdown(self) -> str:
+        lines = [f"**Verdict:** {self.verdict.value.replace('_', ' ')} "
+                 f"(confidence {self.confidence:.0%})"]
+        if self.explanation:
+            lines.append(self.explanation)
+        if self.evidence_urls:
+            lines.append("**Evidence:**\n" + "\n".join(f"- {url}" for url in self.evidence_urls))
+        return "\n\n".join(lines)
+
+
+class VerificationReport(BaseModel):
+    """output_pydantic schema for the full crew's verification_task"""
+    claims: List[ClaimVerdict]
+
+
+class FactCheckResult(BaseModel):
+    """Typed result of one fact check, shared by the UI, caches and the batch exporter"""
+    claims: List[ClaimResult] = Field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    note: str = ""
+
+    @property
+    def complete(self) -> bool:
+        """True when every claim was actually verified (safe to cache)"""
+        return bool(self.claims) and not any(claim.error for claim in self.claims)
+
+    @property
+    def overall_verdict(self) -> Verdict:
+        """
+        FALSE if any claim is false, TRUE only if every claim is true. A claim
+        that failed or timed out caps the verdict at PARTIALLY_TRUE, since the
+        unchecked part may not hold.
+        """
+        verdicts = {claim.verdict for claim in self.claims if not claim.error}
+        if not verdicts:
+            return Verdict.UNVERIFIED
+        if Verdict.FALSE in verdicts:
+            return Verdict.FALSE
+        if verdicts == {Verdict.TRUE}:
+            return Verdict.PARTIALLY_TRUE if any(claim.error for claim in self.claims) else Verdict.TRUE
+        if Verdict.MISLEADING in verdicts:
+            return Verdict.MISLEADING
+        if verdicts & {Verdict.TRUE, Verdict.PARTIALLY_TRUE}:
+            return Verdict.PARTIALLY_TRUE
+        return Verdict.UNVERIFIED
+
+    def to_markdown(self) -> str:
+        """Human-readable report rendered in the UI and text export"""
+        sections = [f"# Fact Verification Report\n\n{len(self.claims)} claim(s) verified."]
+        for number, claim in enumerate(self.claims, start=1):
+            sections.append(f"## Claim {number}: {claim.claim}\n\n{claim.to_markdown()}")
+        if self.note:
+            sections.append(f"---\n*{self.note}*")
+        return "\n\n".join(sections)
+
+    def __str__(self) -> str:
+        return self.to_markdown()
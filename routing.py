@@ -0,0 +1,110 @@
+import re
+import time
+from typing import Callable, Optional
+
+from . import settings
+from .parallel_verify import split_claims, verify_claims
+from .progress import TASK_FINISHED, TASK_STARTED, ProgressEvent
+from .results import FactCheckResult
+from .tracing import span
+from .transcripts import extract_video_id
+
+# Input types, matching the modes offered by app.py
+CLAIM = "claim"
+TEXT = "text"
+URL = "url"
+YOUTUBE = "youtube"
+DOCUMENT = "document"
+
+URL_INPUT = re.compile(r"https?://\S+")
+SENTENCE_END = re.compile(r"[.!?](?:\s|$)")
+
+
+def classify_input(input_content: str, hint: Optional[str] = None) -> str:
+    """
+    Decide which pipeline an input needs. hint is the mode the user picked;
+    a bare link always counts as a URL and a long "claim" is treated as text.
+    """
+    stripped = input_content.strip()
+    if URL_INPUT.fullmatch(stripped):
+        return YOUTUBE if extract_video_id(stripped) else URL
+    if hint == DOCUMENT:
+        return DOCUMENT
+    if len(stripped) <= settings.DIRECT_VERIFY_MAX_CHARS and len(SENTENCE_END.findall(stripped)) <= 2:
+        return CLAIM
+    return TEXT
+
+
+def effective_type(input_content: str, hint: Optional[str] = None) -> Optional[str]:
+    """The route an input actually takes, used to key caches (None when routing is off)"""
+    return classify_input(input_content, hint) if settings.ADAPTIVE_ROUTING else None
+
+
+def _emit(on_event: Optional[Callable], *args, **kwargs) -> None:
+    if on_event is not None:
+        on_event(ProgressEvent(*args, **kwargs))
+
+
+def run_direct_verification(claim: str, checker_factory: Callable,
+                            claim_timeout: float = settings.CLAIM_TIMEOUT,
+                            on_event: Optional[Callable] = None) -> FactCheckResult:
+    """Short claim: skip research and analysis and hand it straight to the verifier"""
+    started = time.monotonic()
+    claim = claim.strip()
+    _emit(on_event, TASK_STARTED, "verification_task", detail="Verifying the claim directly")
+    results = verify_claims([claim], "None yet: search for evidence as needed.", checker_factory,
+                            max_workers=1, claim_timeout=claim_timeout, on_event=on_event)
+    result = FactCheckResult(claims=results, elapsed_seconds=round(time.monotonic() - started, 3))
+    _emit(on_event, TASK_FINISHED, "verification_task", output=result.to_markdown())
+    return result
+
+
+def fetch_source(url: str, input_type: str) -> Optional[str]:
+    """Page text or transcript from the shared caches, without an LLM-driven research step"""
+    with span("tool.direct_fetch", url=url, input_type=input_type) as current:
+        try:
+            if input_type == YOUTUBE:
+                from .transcripts import get_transcript_store
+                text = get_transcript_store().get(extract_video_id(url))
+            else:
+                from .fetch import get_fetcher
+                text = get_fetcher().fetch_text(url)
+        except Exception as e:
+            current.set(error=str(e))
+            return None
+        current.set(payload_bytes=len(text.encode("utf-8")))
+        return text if text.strip() else None
+
+
+def run_source_fact_check(url: str, content: str, checker_factory: Callable,
+                          max_workers: int = settings.VERIFY_CONCURRENCY,
+                          claim_timeout: float = settings.CLAIM_TIMEOUT,
+                          on_event: Optional[Callable] = None) -> FactCheckResult:
+    """
+    URL or video whose text was fetched directly: extract claims from it and
+    verify each against the source, skipping the research agent entirely.
+    """
+    started = time.monotonic()
+    _emit(on_event, TASK_STARTED, "research_task", detail=f"Fetching {url}")
+    _emit(on_event, TASK_FINISHED, "research_task",
+          output=f"Fetched {len(content):,} characters from {url} directly.")
+
+    _emit(on_event, TASK_STARTED, "content_analysis_task", detail="Extracting claims")
+    failures = []
+    if len(content) > settings.CHUNKED_ANALYSIS_THRESHOLD:
+        from .mapreduce import extract_claims_chunked
+        pairs, failures = extract_claims_chunked(content, checker_factory, max_workers, claim_timeout)
+        claims, contexts = [claim for claim, _ in pairs], [chunk for _, chunk in pairs]
+    else:
+        output = checker_factory().claim_extraction_crew().kickoff(inputs={"input_content": content})
+        claims = split_claims(str(output))
+        # One shared context, so verify_claims cuts it to each claim's excerpts
+        contexts = f"Source: {url}\n\n{content}"
+    listing = "\n".join(f"{number}. {claim}" for number, claim in enumerate(claims, start=1))
+    _emit(on_event, TASK_FINISHED, "content_analysis_task", output=listing)
+
+    _emit(on_event, TASK_STARTED, "verification_task", detail=f"{len(claims)} claim(s)")
+    results = verify_claims(claims, contexts, checker_factory, max_workers, claim_timeout, on_event)
+    result = FactCheckResult(claims=results + failures, elapsed_seconds=round(time.monotonic() - started, 3))
+    _emit(on_event, TASK_FINISHED, "verification_task", output=result.to_markdown())
+    return result
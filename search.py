@@ -0,0 +1,179 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import settings
+from .ratelimit import get_limiter
+from .tracing import annotate
+
+
+def normalize_query(query: str) -> str:
+    """Collapse case, whitespace and surrounding punctuation so near-identical queries share a key"""
+    text = unicodedata.normalize("NFKC", query or "").casefold()
+    text = re.sub(r"[\"'“”‘’]", "", text)
+    return " ".join(text.split()).strip(" ?!.,;:")
+
+
+class SerperBackend:
+    """Calls the Serper.dev search API (or any compatible endpoint via SERPER_URL)"""
+
+    def __init__(self, url: str = settings.SERPER_URL, api_key: Optional[str] = None,
+                 num_results: int = settings.SEARCH_NUM_RESULTS):
+        import requests
+
+        self.url = url
+        self.api_key = api_key or os.getenv("SERPER_API_KEY", "")
+        self.num_results = num_results
+        self.session = requests.Session()
+
+    def __call__(self, query: str) -> dict:
+        response = self.session.post(
+            self.url,
+            headers={"X-API-KEY": self.api_key, "Content-Type": "application/json"},
+            data=json.dumps({"q": query, "num": self.num_results}),
+            timeout=settings.FETCH_TIMEOUT,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+class SearchCache:
+    """SQLite store of search results keyed by normalized query, with TTL expiry"""
+
+    def __init__(self, path=None, ttl: int = settings.SEARCH_CACHE_TTL):
+        self.path = path or settings.CACHE_DIR / "search.sqlite3"
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_results ("
+            " query TEXT PRIMARY KEY,"
+            " results TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, query: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, created_at FROM search_results WHERE query = ?", (query,)
+            ).fetchone()
+        if row is None or (self.ttl and time.time() - row[1] > self.ttl):
+            return None
+        return json.loads(row[0])
+
+    def set(self, query: str, results: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (query, results, created_at) VALUES (?, ?, ?)",
+                (query, json.dumps(results), now),
+            )
+            if self.ttl:
+                self._conn.execute("DELETE FROM search_results WHERE created_at < ?", (now - self.ttl,))
+            self._conn.commit()
+
+
+class CachedSearch:
+    """
+    Search front end shared by every agent: normalizes queries, coalesces
+    identical in-flight requests, caches results and counts hits.
+    """
+
+    def __init__(self, backend: Callable[[str], dict] = None, cache: SearchCache = None):
+        self.backend = backend if backend is not None else SerperBackend()
+        self.cache = cache if cache is not None else SearchCache()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "hits": 0, "coalesced": 0, "misses": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def search(self, query: str) -> dict:
+        key = normalize_query(query)
+        self._count("requests")
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count("hits")
+            annotate(cache="hit")
+            return cached
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+        if not owner:
+            self._count("coalesced")
+            annotate(cache="coalesced")
+            return future.result()
+
+        self._count("misses")
+        annotate(cache="miss")
+        try:
+            # The key only identifies cache entries; the provider gets the query as written (quotes matter)
+            results = get_limiter("search").call(self.backend, query)
+            self.cache.set(key, results)
+            future.set_result(results)
+            return results
+        except Exception as e:
+            self._count("errors")
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self) -> dict:
+        """Counters plus the share of requests answered without calling the backend"""
+        with self._lock:
+            stats = dict(self.counters)
+        served = stats["hits"] + stats["coalesced"]
+        stats["hit_rate"] = served / stats["requests"] if stats["requests"] else 0.0
+        return stats
+
+
+def format_results(results: dict, limit: int = settings.SEARCH_NUM_RESULTS) -> str:
+    """Render Serper-style results as compact text for the agents"""
+    lines = []
+    answer = results.get("answerBox") or {}
+    if answer.get("answer") or answer.get("snippet"):
+        lines.append(f"Answer: {answer.get('answer') or answer.get('snippet')}")
+    for item in results.get("organic", [])[:limit]:
+        lines.append(f"Title: {item.get('title', '')}\nLink: {item.get('link', '')}\n"
+                     f"Snippet: {item.get('snippet', '')}\n---")
+    return "\n".join(lines) or "No results found."
+
+
+_search = None
+_search_lock = threading.Lock()
+
+
+def get_search() -> CachedSearch:
+    """Process-wide search layer shared by all agents and runs"""
+    global _search
+    with _search_lock:
+        if _search is None:
+            _search = CachedSearch()
+        return _search
+
+
+def configure_search(backend: Callable[[str], dict] = None, cache: SearchCache = None) -> CachedSearch:
+    """Replace the shared search layer, e.g. with a local fake backend and in-memory cache"""
+    global _search
+    with _search_lock:
+        _search = CachedSearch(backend, cache)
+        return _search
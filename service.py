@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from . import settings
+from .jobs import DONE, FAILED, Job, JobManager, QueueFull
+from .ratelimit import BATCH, INTERACTIVE, limiter_stats
+
+
+def job_to_dict(job: Job, include_result: bool = False) -> dict:
+    data = {
+        "id": job.id,
+        "status": job.status,
+        "stage": job.stage,
+        "progress": job.progress,
+        "tokens": job.tokens,
+        "coalesced": job.coalesced,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+    if job.status == FAILED:
+        data["error"] = job.error
+    if job.status == DONE and job.result is not None:
+        data["verdict"] = job.result.overall_verdict.value
+        if include_result:
+            data["result"] = job.result.model_dump(mode="json")
+            data["timings"] = job.timings
+    return data
+
+
+class FactCheckService:
+    """
+    Job manager plus batch bookkeeping behind the HTTP API. Workers are the
+    job manager's long-lived threads; crewai, the YAML config, shared tools
+    and connection pools are loaded once up front by warm().
+    """
+
+    def __init__(self, workers: int = settings.SERVICE_WORKERS, max_queue: int = settings.SERVICE_MAX_QUEUE,
+                 batch_workers: int = settings.SERVICE_BATCH_WORKERS,
+                 max_batch_queue: int = settings.SERVICE_MAX_BATCH_QUEUE):
+        self.jobs = JobManager(max_workers=workers, max_queued=max_queue,
+                               batch_workers=batch_workers, max_batch_queued=max_batch_queue)
+        self.started_at = time.time()
+        self._batches = {}
+        self._lock = threading.Lock()
+
+    def warm(self) -> None:
+        """Build the FactChecker template, shared tools and one crew before taking traffic"""
+        from .crew import create_fact_checker, shared_tools
+        shared_tools()
+        create_fact_checker().crew()
+
+    def submit(self, input_content: str, input_type: Optional[str] = None, level: int = INTERACTIVE) -> str:
+        return self.jobs.submit(input_content, input_type=input_type, level=level)
+
+    def submit_batch(self, items: list) -> dict:
+        """Queue many checks at batch priority; items beyond the queue limit are reported as rejected"""
+        job_ids, rejected = [], []
+        for position, item in enumerate(items):
+            content, input_type = (item, None) if isinstance(item, str) else (item.get("input"), item.get("input_type"))
+            if not content or not str(content).strip():
+                rejected.append({"index": position, "error": "empty input"})
+                continue
+            try:
+                job_ids.append(self.submit(str(content), input_type, level=BATCH))
+            except QueueFull as e:
+                rejected.append({"index": position, "error": str(e)})
+        batch_id = uuid.uuid4().hex
+        with self._lock:
+            self._prune_batches()
+            self._batches[batch_id] = (time.time(), job_ids)
+        return {"id": batch_id, "jobs": job_ids, "rejected": rejected}
+
+    def _prune_batches(self) -> None:
+        # A batch is forgotten once it is older than the job retention and none of its jobs remain
+        cutoff = time.time() - self.jobs.retention
+        expired = [batch_id for batch_id, (created_at, job_ids) in self._batches.items()
+                   if created_at < cutoff and all(self.jobs.get(job_id) is None for job_id in job_ids)]
+        for batch_id in expired:
+            del self._batches[batch_id]
+
+    def batch(self, batch_id: str, include_results: bool = False) -> Optional[dict]:
+        with self._lock:
+            self._prune_batches()
+            _, job_ids = self._batches.get(batch_id, (None, None))
+        if job_ids is None:
+            return None
+        jobs = [job_to_dict(job, include_results) if job else {"id": job_id, "status": "expired"}
+                for job_id, job in ((job_id, self.jobs.get(job_id)) for job_id in job_ids)]
+        finished = sum(job["status"] in (DONE, FAILED, "expired") for job in jobs)
+        return {"id": batch_id, "total": len(jobs), "finished": finished, "jobs": jobs}
+
+    def health(self) -> dict:
+        return {"status": "ok", "uptime_seconds": round(time.time() - self.started_at, 1),
+                "jobs": self.jobs.stats(), "rate_limits": limiter_stats()}
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    POST /v1/checks             {"input": ..., "input_type": optional} -> 202 {"id", "status"}
+    GET  /v1/checks/<id>        status and progress
+    GET  /v1/checks/<id>/result verdict, full result and timings once finished
+    POST /v1/batches            {"inputs": [str | {"input", "input_type"}]} -> 202 {"id", "jobs", "rejected"}
+    GET  /v1/batches/<id>       per-job status (?results=1 includes finished results)
+    GET  /healthz               job counts and rate-limiter metrics
+    """
+    service: FactCheckService = None
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: dict, headers: dict = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self, length: int) -> Optional[dict]:
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else None
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            return self._send(400, {"error": "invalid Content-Length"})
+        if length > settings.SERVICE_MAX_BODY_BYTES:
+            # The body is never read, so the connection can't be reused
+            self.close_connection = True
+            return self._send(413, {"error": f"request body larger than {settings.SERVICE_MAX_BODY_BYTES} bytes"})
+        body = self._body(length)
+        if body is None:
+            return self._send(400, {"error": "request body must be a JSON object"})
+        path = self.path.split("?")[0].rstrip("/")
+        if path == "/v1/checks":
+            content = body.get("input")
+            if not isinstance(content, str) or not content.strip():
+                return self._send(400, {"error": "'input' must be a non-empty string"})
+            try:
+                job_id = self.service.submit(content, body.get("input_type"))
+            except QueueFull as e:
+                return self._send(429, {"error": str(e)}, {"Retry-After": "5"})
+            return self._send(202, job_to_dict(self.service.jobs.get(job_id)), {"Location": f"/v1/checks/{job_id}"})
+        if path == "/v1/batches":
+            items = body.get("inputs")
+            if not isinstance(items, list) or not items:
+                return self._send(400, {"error": "'inputs' must be a non-empty list"})
+            if len(items) > settings.SERVICE_MAX_BATCH:
+                return self._send(413, {"error": f"at most {settings.SERVICE_MAX_BATCH} inputs per batch"})
+            return self._send(202, self.service.submit_batch(items))
+        self._send(404, {"error": "not found"})
+
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        path = path.rstrip("/")
+        if path == "/healthz":
+            return self._send(200, self.service.health())
+        match = re.fullmatch(r"/v1/checks/([0-9a-f]+)(/result)?", path)
+        if match:
+            job = self.service.jobs.get(match.group(1))
+            if job is None:
+                return self._send(404, {"error": "unknown or expired check"})
+            if match.group(2) and not job.finished:
+                return self._send(409, job_to_dict(job))
+            return self._send(200, job_to_dict(job, include_result=bool(match.group(2))))
+        match = re.fullmatch(r"/v1/batches/([0-9a-f]+)", path)
+        if match:
+            batch = self.service.batch(match.group(1), include_results="results=1" in query)
+            if batch is None:
+                return self._send(404, {"error": "unknown batch"})
+            return self._send(200, batch)
+        self._send(404, {"error": "not found"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host: str = settings.SERVICE_HOST, port: int = settings.SERVICE_PORT,
+          service: FactCheckService = None, warm: bool = True) -> ThreadingHTTPServer:
+    """Create (but don't start) the HTTP server around a warmed-up service"""
+    service = service or FactCheckService()
+    if warm:
+        try:
+            service.warm()
+        except Exception as e:
+            # The first real check will surface the problem with details
+            print(f"Warm-up failed: {e}")
+    handler = type("FactCheckHandler", (Handler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    """
+    Run the headless fact-check API.
+    Usage: serve [port] [host]
+    """
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else settings.SERVICE_PORT
+    host = sys.argv[2] if len(sys.argv) > 2 else settings.SERVICE_HOST
+    server = serve(host, port)
+    print(f"SatyaGyan API listening on http://{host}:{port} "
+          f"({server.RequestHandlerClass.service.jobs.max_workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+
+# Application settings, overridable through environment variables (.env)
+
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_DIR = BASE_DIR / "config"
+CACHE_DIR = Path(os.getenv("SATYAGYAN_CACHE_DIR", BASE_DIR / ".satyagyan_cache"))
+
+# Verdict cache
+VERDICT_CACHE_TTL = int(os.getenv("SATYAGYAN_VERDICT_TTL", 24 * 60 * 60))
+VERDICT_CACHE_MAX_ENTRIES = int(os.getenv("SATYAGYAN_VERDICT_MAX_ENTRIES", 5000))
+
+# Shared page fetcher
+FETCH_TIMEOUT = int(os.getenv("SATYAGYAN_FETCH_TIMEOUT", 15))
+FETCH_POOL_SIZE = int(os.getenv("SATYAGYAN_FETCH_POOL_SIZE", 10))
+PAGE_CACHE_MAX_BYTES = int(os.getenv("SATYAGYAN_PAGE_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+PAGE_CACHE_FRESH_SECONDS = int(os.getenv("SATYAGYAN_PAGE_CACHE_FRESH_SECONDS", 10 * 60))
+# "readability" keeps only a page's main content plus title/author/date; "soup" is the old full-page text
+HTML_EXTRACTOR = os.getenv("SATYAGYAN_HTML_EXTRACTOR", "readability").lower()
+
+# YouTube transcript store
+TRANSCRIPT_MEMORY_ITEMS = int(os.getenv("SATYAGYAN_TRANSCRIPT_MEMORY_ITEMS", 64))
+
+# Parallel claim verification
+PARALLEL_VERIFY = os.getenv("SATYAGYAN_PARALLEL_VERIFY", "true").lower() in ("1", "true", "yes")
+VERIFY_CONCURRENCY = int(os.getenv("SATYAGYAN_VERIFY_CONCURRENCY", 4))
+CLAIM_TIMEOUT = float(os.getenv("SATYAGYAN_CLAIM_TIMEOUT", 120))
+
+# Background analysis jobs
+JOB_WORKERS = int(os.getenv("SATYAGYAN_JOB_WORKERS", 4))
+JOB_RETENTION_SECONDS = int(os.getenv("SATYAGYAN_JOB_RETENTION", 60 * 60))
+JOB_POLL_INTERVAL = float(os.getenv("SATYAGYAN_JOB_POLL_INTERVAL", 1.0))
+
+# Headless HTTP service
+SERVICE_HOST = os.getenv("SATYAGYAN_SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.getenv("SATYAGYAN_SERVICE_PORT", 8080))
+SERVICE_WORKERS = int(os.getenv("SATYAGYAN_SERVICE_WORKERS", JOB_WORKERS))
+SERVICE_MAX_QUEUE = int(os.getenv("SATYAGYAN_SERVICE_MAX_QUEUE", 200))
+SERVICE_MAX_BATCH = int(os.getenv("SATYAGYAN_SERVICE_MAX_BATCH", 500))
+# Batch jobs run on their own workers and queue budget, so they never hold up interactive checks
+SERVICE_BATCH_WORKERS = int(os.getenv("SATYAGYAN_SERVICE_BATCH_WORKERS", max(1, SERVICE_WORKERS // 2)))
+SERVICE_MAX_BATCH_QUEUE = int(os.getenv("SATYAGYAN_SERVICE_MAX_BATCH_QUEUE", 2000))
+SERVICE_MAX_BODY_BYTES = int(os.getenv("SATYAGYAN_SERVICE_MAX_BODY_BYTES", 32 * 1024 * 1024))
+
+# Durable multi-node work queue (sqlite:///path for one host, http://host:port for a shared queue)
+WORK_QUEUE_URL = os.getenv("SATYAGYAN_WORK_QUEUE_URL", f"sqlite://{CACHE_DIR / 'workqueue.sqlite3'}")
+WORK_QUEUE_HOST = os.getenv("SATYAGYAN_WORK_QUEUE_HOST", "127.0.0.1")
+WORK_QUEUE_PORT = int(os.getenv("SATYAGYAN_WORK_QUEUE_PORT", 8090))
+# Shared secret sent by HTTPQueue clients; required before the queue listens beyond localhost
+WORK_QUEUE_TOKEN = os.getenv("SATYAGYAN_WORK_QUEUE_TOKEN", "")
+WORK_VISIBILITY_TIMEOUT = float(os.getenv("SATYAGYAN_WORK_VISIBILITY_TIMEOUT", 300))
+WORK_MAX_ATTEMPTS = int(os.getenv("SATYAGYAN_WORK_MAX_ATTEMPTS", 3))
+WORK_RETRY_BACKOFF = float(os.getenv("SATYAGYAN_WORK_RETRY_BACKOFF", 10))
+WORK_POLL_INTERVAL = float(os.getenv("SATYAGYAN_WORK_POLL_INTERVAL", 2.0))
+
+# Batch fact-checking
+BATCH_WORKERS = int(os.getenv("SATYAGYAN_BATCH_WORKERS", 4))
+
+# Document extraction
+PDF_WORKERS = int(os.getenv("SATYAGYAN_PDF_WORKERS", max(1, min(4, os.cpu_count() or 1))))
+PDF_PAGES_PER_JOB = int(os.getenv("SATYAGYAN_PDF_PAGES_PER_JOB", 16))
+DOCUMENT_CHUNK_CHARS = int(os.getenv("SATYAGYAN_DOCUMENT_CHUNK_CHARS", 12000))
+# Uploads are spooled to disk and rejected above these limits; the encoding is guessed from the first bytes
+UPLOAD_MAX_BYTES = int(os.getenv("SATYAGYAN_UPLOAD_MAX_BYTES", 25 * 1024 * 1024))
+UPLOAD_MAX_CHARS = int(os.getenv("SATYAGYAN_UPLOAD_MAX_CHARS", 1_000_000))
+UPLOAD_SNIFF_BYTES = int(os.getenv("SATYAGYAN_UPLOAD_SNIFF_BYTES", 64 * 1024))
+
+# Input-type-aware routing: reduced crews for short claims and directly fetched links
+ADAPTIVE_ROUTING = os.getenv("SATYAGYAN_ADAPTIVE_ROUTING", "true").lower() in ("1", "true", "yes")
+DIRECT_VERIFY_MAX_CHARS = int(os.getenv("SATYAGYAN_DIRECT_VERIFY_MAX_CHARS", 300))
+
+# Chunked map-reduce analysis for large documents
+CHUNKED_ANALYSIS_THRESHOLD = int(os.getenv("SATYAGYAN_CHUNKED_ANALYSIS_THRESHOLD", 20000))
+CHUNK_OVERLAP_CHARS = int(os.getenv("SATYAGYAN_CHUNK_OVERLAP_CHARS", 800))
+CLAIM_DEDUPE_THRESHOLD = float(os.getenv("SATYAGYAN_CLAIM_DEDUPE_THRESHOLD", 0.8))
+
+# Context compaction: claims are verified against their supporting excerpts, not the whole research dump
+CONTEXT_COMPACTION = os.getenv("SATYAGYAN_CONTEXT_COMPACTION", "true").lower() in ("1", "true", "yes")
+COMPACT_CONTEXT_CHARS = int(os.getenv("SATYAGYAN_COMPACT_CONTEXT_CHARS", 3000))
+
+# Cross-run claim deduplication index
+CLAIM_INDEX_THRESHOLD = float(os.getenv("SATYAGYAN_CLAIM_INDEX_THRESHOLD", 0.8))
+CLAIM_INDEX_MAX_CHARS = int(os.getenv("SATYAGYAN_CLAIM_INDEX_MAX_CHARS", 500))
+CLAIM_INDEX_MAX_AGE = int(os.getenv("SATYAGYAN_CLAIM_INDEX_MAX_AGE", 7 * 24 * 60 * 60))
+
+# Evidence search
+SERPER_URL = os.getenv("SERPER_URL", "https://google.serper.dev/search")
+SEARCH_NUM_RESULTS = int(os.getenv("SATYAGYAN_SEARCH_NUM_RESULTS", 8))
+SEARCH_CACHE_TTL = int(os.getenv("SATYAGYAN_SEARCH_CACHE_TTL", 6 * 60 * 60))
+
+# Outbound rate limits: (requests per second, burst) per provider; 0 disables a limit
+RATE_LIMITS = {
+    "llm": (float(os.getenv("SATYAGYAN_LLM_RATE", 3)), int(os.getenv("SATYAGYAN_LLM_BURST", 6))),
+    "search": (float(os.getenv("SATYAGYAN_SEARCH_RATE", 5)), int(os.getenv("SATYAGYAN_SEARCH_BURST", 10))),
+    "scrape": (float(os.getenv("SATYAGYAN_SCRAPE_RATE", 10)), int(os.getenv("SATYAGYAN_SCRAPE_BURST", 20))),
+    "transcript": (float(os.getenv("SATYAGYAN_TRANSCRIPT_RATE", 2)), int(os.getenv("SATYAGYAN_TRANSCRIPT_BURST", 4))),
+}
+RATE_LIMIT_RETRIES = int(os.getenv("SATYAGYAN_RATE_LIMIT_RETRIES", 4))
+RATE_LIMIT_BACKOFF = float(os.getenv("SATYAGYAN_RATE_LIMIT_BACKOFF", 1.0))
+RATE_LIMIT_MAX_BACKOFF = float(os.getenv("SATYAGYAN_RATE_LIMIT_MAX_BACKOFF", 30.0))
+# Give up retrying once a call has spent this long (queueing, attempts and backoff); 0 disables the cap
+RATE_LIMIT_MAX_ELAPSED = float(os.getenv("SATYAGYAN_RATE_LIMIT_MAX_ELAPSED", 120.0))
+
+# Per-run tracing (JSON lines, OpenTelemetry-style spans); set to an empty string to disable
+TRACE_FILE = os.getenv("SATYAGYAN_TRACE_FILE", str(CACHE_DIR / "traces.jsonl"))
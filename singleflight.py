@@ -0,0 +1,71 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+
+class Flight:
+    """One in-progress run that identical requests attach to"""
+
+    def __init__(self):
+        self.future = Future()
+        self.followers = 0
+        self._events = []
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def emit(self, event) -> None:
+        """Forward a progress event to every attached request (delivered in order)"""
+        with self._lock:
+            self._events.append(event)
+            for listener in self._listeners:
+                listener(event)
+
+    def subscribe(self, listener: Callable) -> None:
+        """Attach a listener, replaying the events it missed before joining"""
+        with self._lock:
+            for event in self._events:
+                listener(event)
+            self._listeners.append(listener)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the
+    work, later callers wait for and share its result (and progress events).
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self._lock = threading.Lock()
+        self.counters = {"leaders": 0, "followers": 0}
+
+    def run(self, key: str, func: Callable, on_event: Optional[Callable] = None):
+        """Call func(emit) unless an identical call is already running, then return its result"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Flight()
+                self.counters["leaders"] += 1
+            else:
+                flight.followers += 1
+                self.counters["followers"] += 1
+        if on_event is not None:
+            flight.subscribe(on_event)
+        if not leader:
+            return flight.future.result()
+
+        try:
+            result = func(flight.emit)
+            flight.future.set_result(result)
+            return result
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
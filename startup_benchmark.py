@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from . import settings
+
+# Imported by app.py on every run vs. only when an analysis or upload needs them
+APP_MODULES = [
+    "fact_checker.transcripts",
+    "fact_checker.jobs",
+    "fact_checker.documents",
+    "fact_checker.progress",
+    "fact_checker.routing",
+]
+DEFERRED_MODULES = [
+    "fact_checker.crew",
+    "crewai_tools",
+    "PyPDF2",
+]
+
+_CHILD = (
+    "import time, importlib\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module({module!r})\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def cold_import_seconds(module: str, repeats: int = 5):
+    """Median import time of a module in a fresh interpreter, or None if it can't be imported"""
+    samples = []
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, "-c", _CHILD.format(module=module)],
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            return None
+        samples.append(float(completed.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def app_run_seconds(repeats: int = 5):
+    """First-run and median rerun latency of app.py under Streamlit's AppTest harness"""
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    app = AppTest.from_file(str(settings.BASE_DIR / "app.py"), default_timeout=60)
+    start = time.perf_counter()
+    app.run()
+    first = time.perf_counter() - start
+    reruns = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        app.run()
+        reruns.append(time.perf_counter() - start)
+    return {"first_run": first, "rerun_median": statistics.median(reruns)}
+
+
+def main():
+    """
+    Report cold import times and Streamlit run/rerun latency.
+    Usage: startup_benchmark [repeats] [output.json]
+    """
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    report = {
+        "app_imports": {module: cold_import_seconds(module, repeats) for module in APP_MODULES},
+        "deferred_imports": {module: cold_import_seconds(module, repeats) for module in DEFERRED_MODULES},
+        "app_runs": app_run_seconds(repeats),
+    }
+
+    for section in ("app_imports", "deferred_imports"):
+        print(f"\n{section}:")
+        for module, seconds in report[section].items():
+            print(f"  {module:<28} {'unavailable' if seconds is None else f'{seconds * 1000:8.1f} ms'}")
+    if report["app_runs"]:
+        print(f"\napp.py first run: {report['app_runs']['first_run'] * 1000:.1f} ms, "
+              f"rerun median: {report['app_runs']['rerun_median'] * 1000:.1f} ms")
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
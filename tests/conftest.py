@@ -0,0 +1,41 @@
+import importlib
+import importlib.util
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Keep caches and traces out of the source tree before settings is imported
+os.environ.setdefault("SATYAGYAN_CACHE_DIR", tempfile.mkdtemp(prefix="satyagyan-tests-"))
+os.environ.setdefault("SATYAGYAN_TRACE_FILE", "")
+
+# The project directory is the fact_checker package; make it importable under that name
+try:
+    importlib.import_module("fact_checker")
+except ImportError:
+    root = Path(__file__).resolve().parent.parent
+    spec = importlib.util.spec_from_file_location("fact_checker", root / "__init__.py",
+                                                  submodule_search_locations=[str(root)])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["fact_checker"] = module
+    spec.loader.exec_module(module)
+
+
+class Clock:
+    """A time.time stand-in that only moves when a test advances it"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
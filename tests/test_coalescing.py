@@ -0,0 +1,101 @@
+import threading
+import time
+import uuid
+
+from fact_checker import pipeline, tracing
+from fact_checker.jobs import DONE, JobManager
+from fact_checker.results import ClaimResult, FactCheckResult, Verdict
+
+THREADS = 8
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_identical_fact_checks_share_one_execution(monkeypatch):
+    # A unique input so neither the verdict cache nor the claim index can answer it
+    text = f"Coalescing test {uuid.uuid4().hex}: the council approved the new budget in March."
+    calls = []
+    followers = pipeline._in_flight.counters["followers"]
+
+    def fake_execute(input_content, on_event=None, checker_factory=None, input_type=None):
+        calls.append(input_content)
+        # Hold the run until every other caller has attached to it
+        assert wait_for(lambda: pipeline._in_flight.counters["followers"] - followers >= THREADS - 1)
+        # An error keeps the result out of the caches, so only coalescing can explain one call
+        return FactCheckResult(claims=[ClaimResult.failed(input_content, "stubbed")])
+
+    monkeypatch.setattr(pipeline, "execute", fake_execute)
+    results = [None] * THREADS
+
+    def check(index: int) -> None:
+        results[index] = pipeline.run_fact_check(text)
+
+    threads = [threading.Thread(target=check, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert results[0].claims[0].claim == text
+
+
+def test_job_manager_attaches_duplicates_to_the_active_job():
+    release = threading.Event()
+    calls = []
+
+    def runner(input_content, on_event=None, input_type=None):
+        calls.append(input_content)
+        release.wait(5)
+        return FactCheckResult(claims=[ClaimResult(claim=input_content, verdict=Verdict.TRUE)])
+
+    manager = JobManager(runner=runner, max_workers=4)
+    ids = [manager.submit("The bridge opened in 1932.") for _ in range(THREADS)]
+    # Whitespace and case differences normalize to the same input
+    ids.append(manager.submit("  the bridge opened in 1932. "))
+    other = manager.submit("The tunnel opened in 1934.")
+
+    assert len(set(ids)) == 1
+    assert other != ids[0]
+    job = manager.get(ids[0])
+    assert job.coalesced == THREADS
+
+    release.set()
+    assert wait_for(lambda: job.finished and manager.get(other).finished)
+    assert job.status == DONE
+    assert sorted(calls) == ["The bridge opened in 1932.", "The tunnel opened in 1934."]
+
+    # Once the job finished, the same input starts a fresh one
+    again = manager.submit("The bridge opened in 1932.")
+    assert again != ids[0]
+    assert wait_for(lambda: manager.get(again).finished)
+    assert len(calls) == 3
+
+
+def test_submit_while_a_job_is_finishing(monkeypatch):
+    finishing, release = threading.Event(), threading.Event()
+    breakdown = tracing.Trace.breakdown
+
+    def slow_breakdown(self):
+        finishing.set()
+        release.wait(5)
+        return breakdown(self)
+
+    monkeypatch.setattr(tracing.Trace, "breakdown", slow_breakdown)
+    manager = JobManager(runner=lambda content, on_event=None, input_type=None: FactCheckResult(),
+                         max_workers=2, retention=0)
+    first = manager.submit("The dam was finished in 1936.")
+    assert finishing.wait(5)
+    # The first job's crew is done but its timings aren't recorded yet: pruning must leave it alone
+    assert not manager.get(first).finished
+    manager.submit("The canal was finished in 1914.")
+    release.set()
+    assert wait_for(lambda: manager.get(first) is None or manager.get(first).finished)
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+from fact_checker.crew import create_fact_checker
+from fact_checker.progress import TASK_LABELS, CrewProgress
+
+
+@pytest.fixture(autouse=True)
+def offline_llm(monkeypatch):
+    # Building agents only needs a key to be present; nothing is sent
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+def test_full_crew_tasks_are_named_after_their_config():
+    crew = create_fact_checker().crew()
+    names = [task.name for task in crew.tasks]
+    assert names == ["research_task", "content_analysis_task", "verification_task"]
+    # Progress events use these names to look up labels and progress steps
+    assert CrewProgress(crew, lambda event: None).task_names == names
+    assert all(name in TASK_LABELS for name in names)
+
+
+def test_split_crews_keep_task_names():
+    checker = create_fact_checker()
+    assert [task.name for task in checker.analysis_crew().tasks] == ["research_task", "content_analysis_task"]
+    assert [task.name for task in checker.claim_extraction_crew().tasks] == ["content_analysis_task"]
+    assert [task.name for task in checker.claim_verification_crew().tasks] == ["verification_task"]
@@ -0,0 +1,96 @@
+import codecs
+import logging
+
+import pytest
+
+from fact_checker import documents
+from fact_checker.documents import detect_encoding, iter_text
+
+
+def write(tmp_path, data: bytes):
+    path = tmp_path / "upload.txt"
+    path.write_bytes(data)
+    return str(path)
+
+
+def decode(tmp_path, data: bytes, **kwargs) -> str:
+    return "".join(iter_text(write(tmp_path, data), **kwargs))
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    (codecs.BOM_UTF8 + "café".encode("utf-8"), "utf-8-sig"),
+    (codecs.BOM_UTF16_LE + "café".encode("utf-16-le"), "utf-16"),
+    ("plain café".encode("utf-16-le"), "utf-16-le"),
+    ("plain café".encode("utf-16-be"), "utf-16-be"),
+    ("café crème".encode("utf-8"), "utf-8"),
+    (b"ascii only", "utf-8"),
+])
+def test_detect_encoding(prefix, expected):
+    assert detect_encoding(prefix, complete=True) == expected
+
+
+def test_detect_encoding_tolerates_a_character_cut_at_the_end_of_the_prefix():
+    data = "naïve".encode("utf-8")
+    assert detect_encoding(data[:3]) == "utf-8"
+    assert detect_encoding(data[:3], complete=True) != "utf-8"
+
+
+def test_legacy_text_falls_back_from_utf8(monkeypatch):
+    monkeypatch.setattr(documents, "from_bytes", None)
+    assert detect_encoding("café à 5 €".encode("cp1252"), complete=True) == "cp1252"
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 7, 64])
+def test_multibyte_characters_split_across_blocks(tmp_path, block_size):
+    text = "Ünïcödé ✓ 日本語 " * 20 + "🙂 end"
+    assert decode(tmp_path, text.encode("utf-8"), block_size=block_size, sniff_bytes=16) == text
+
+
+@pytest.mark.parametrize("block_size", [2, 5, 16])
+def test_utf16_split_across_blocks(tmp_path, block_size):
+    text = "hello wörld 🙂 " * 10
+    assert decode(tmp_path, text.encode("utf-16"), block_size=block_size) == text
+
+
+@pytest.mark.parametrize("block_size", [3, 16, 101, 4096])
+def test_cp1252_tail_after_ascii_prefix(tmp_path, caplog, monkeypatch, block_size):
+    monkeypatch.setattr(documents, "from_bytes", None)
+    head, tail = "a" * 100, "Café costs 5 € — naïve “quotes”"
+    with caplog.at_level(logging.INFO, logger="fact_checker.documents"):
+        text = decode(tmp_path, (head + tail).encode("cp1252"), block_size=block_size, sniff_bytes=50)
+    assert text == head + tail
+    assert "�" not in text
+    assert "decoding the rest as cp1252" in caplog.text
+    # The switch happens exactly at the first non-ASCII byte
+    assert f"after byte {len(head) + 3}" in caplog.text
+
+
+@pytest.mark.parametrize("block_size", [4, 7, 1000])
+def test_cp1252_tail_after_utf8_text_keeps_both(tmp_path, monkeypatch, block_size):
+    monkeypatch.setattr(documents, "from_bytes", None)
+    head = "é" * 40
+    data = head.encode("utf-8") + "ü end".encode("cp1252")
+    assert decode(tmp_path, data, block_size=block_size, sniff_bytes=10) == head + "ü end"
+
+
+def test_empty_file(tmp_path):
+    assert decode(tmp_path, b"") == ""
+
+
+def test_pdf_text_limit_stops_reading_pages(tmp_path, monkeypatch):
+    read = []
+
+    def pages(path):
+        for number in range(100):
+            read.append(number)
+            yield f"page {number} " + "x" * 90
+
+    monkeypatch.setattr(documents, "iter_pdf_pages", pages)
+    upload = tmp_path / "report.pdf"
+    upload.write_bytes(b"%PDF-1.4")
+    assert documents.read_upload(str(upload), "report.pdf", max_chars=10_000).startswith("page 0 ")
+    read.clear()
+    with pytest.raises(documents.UploadTooLarge):
+        documents.read_upload(str(upload), "report.pdf", max_chars=1_000)
+    # The limit is checked page by page, not after the whole document is joined
+    assert len(read) == 11
@@ -0,0 +1,92 @@
+import pytest
+
+from fact_checker import extraction, settings
+from fact_checker.extraction import MIN_CONTENT_CHARS
+
+EXTRACTORS = [
+    pytest.param(extraction._extract_streaming, id="streaming"),
+    pytest.param(extraction._extract_lxml, id="lxml",
+                 marks=pytest.mark.skipif(extraction.lxml is None, reason="lxml not installed")),
+]
+
+PARAGRAPHS = [
+    "The city council approved the budget on Tuesday, allocating 4.2 million to road repairs, "
+    "according to the published minutes of the meeting.",
+    "Officials said the repairs would begin in the spring and finish before the end of the year, "
+    "weather permitting, with the main bridge closed for six weeks.",
+    "Residents who spoke at the meeting raised concerns about traffic during the closure, and the "
+    "council agreed to publish a detour plan next month.",
+]
+ARTICLE = "".join(f"<p>{paragraph}</p>" for paragraph in PARAGRAPHS)
+NAV = '<nav><a href="/">Home</a> <a href="/about">About us</a></nav>'
+
+
+def page(body: str, body_attrs: str = "") -> str:
+    return f"<html><head><title>Budget</title></head><body{body_attrs}>{body}</body></html>"
+
+
+def assert_article(text: str) -> None:
+    for paragraph in PARAGRAPHS:
+        assert paragraph in text
+    assert "About us" not in text
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+def test_embed_does_not_hide_the_rest_of_the_page(extract):
+    html = page(f'{NAV}<div class="story"><embed src="/chart.swf" type="application/x-shockwave-flash">'
+                f"{ARTICLE}</div>")
+    assert_article(extract(html).text)
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+def test_body_class_hint_is_ignored(extract):
+    html = page(f'{NAV}<div class="story">{ARTICLE}</div>', body_attrs=' class="has-sidebar"')
+    assert_article(extract(html).text)
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+def test_form_wrapped_page_keeps_its_content(extract):
+    html = page(f'<form id="aspnetForm" method="post" action="./story.aspx">'
+                f'<input type="hidden" name="__VIEWSTATE" value="abc">{NAV}'
+                f'<div id="content">{ARTICLE}</div><button>Subscribe</button></form>')
+    text = extract(html).text
+    assert_article(text)
+    assert "Subscribe" not in text
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+def test_lead_paragraph_is_not_mistaken_for_an_ad(extract):
+    lead = "Council members voted seven to two in favour of the plan after a three hour debate on Tuesday."
+    html = page(f'{NAV}<div class="ad-slot"><p>Advertisement: buy one get one free at our partner stores today.</p></div>'
+                f'<div class="story"><div class="lead-paragraph"><p>{lead}</p></div>{ARTICLE}</div>')
+    text = extract(html).text
+    assert lead in text
+    assert_article(text)
+    assert "Advertisement" not in text
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+def test_short_extraction_falls_back_to_the_whole_page(extract):
+    html = page('<div class="sidebar"><p>' + "Only the sidebar has any text on this page at all. " * 6
+                + "</p></div><script>var x = 1;</script>")
+    text = extract(html).text
+    assert len(text) >= MIN_CONTENT_CHARS
+    assert "Only the sidebar has any text" in text
+    assert "var x" not in text
+
+
+SAVED_PAGES = {
+    "news-article.html": ("lowest August figure in ten years", "Most read"),
+    "blog-post.html": ("there was no control group", "Leave a comment"),
+    "forum-thread.html": ("lists fluoride at an average of 0.21 mg/l", "Board index"),
+    "aspnet-form.html": ("Around 14,000 households in Northfield", "Was this page useful?"),
+}
+
+
+@pytest.mark.parametrize("extract", EXTRACTORS)
+@pytest.mark.parametrize("name, kept, dropped", [(name, *texts) for name, texts in SAVED_PAGES.items()])
+def test_benchmark_pages(extract, name, kept, dropped):
+    html = (settings.BASE_DIR / "benchmarks" / "pages" / name).read_text(encoding="utf-8")
+    text = extract(html).text
+    assert kept in text
+    assert dropped not in text
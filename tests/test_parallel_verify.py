@@ -0,0 +1,49 @@
+import threading
+import time
+
+from fact_checker.parallel_verify import run_bounded, split_claims
+
+
+def test_split_claims_formats():
+    assert split_claims('{"claims": [{"text": "A"}, "B"]}') == ["A", "B"]
+    assert split_claims("1. First claim\n- Second claim\nClaim 3: Third claim") == [
+        "First claim", "Second claim", "Third claim"]
+    assert split_claims("  ") == []
+
+
+def test_run_bounded_keeps_order_and_isolates_failures():
+    stopped = threading.Event()
+
+    def work(index, item, cancelled):
+        if item == "boom":
+            raise RuntimeError("no luck")
+        if item == "hang":
+            # A crew's step callback polls the event like this between steps
+            while not cancelled.wait(0.01):
+                pass
+            stopped.set()
+            return "late"
+        time.sleep(0.01 * (3 - index))
+        return item.upper()
+
+    def failed(index, message, elapsed):
+        return f"{index}: {message}"
+
+    started = time.monotonic()
+    results = run_bounded(["a", "boom", "hang", "b"], work, max_workers=2, timeout=0.3, on_failure=failed)
+    assert results == ["A", "1: failed: no luck", "2: timed out after 0s", "B"]
+    assert time.monotonic() - started < 3
+    assert stopped.wait(2)
+
+
+def test_run_bounded_batch_deadline_fails_items_still_queued():
+    release = threading.Event()
+
+    def work(index, item, cancelled):
+        release.wait(5)
+        return item
+
+    results = run_bounded(list("abc"), work, max_workers=1, timeout=0.2,
+                          on_failure=lambda index, message, elapsed: None)
+    release.set()
+    assert results == [None, None, None]
@@ -0,0 +1,34 @@
+import pytest
+
+from fact_checker.results import ClaimResult, FactCheckResult, Verdict, parse_verdict
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Verdict: TRUE. The claim is not misleading.", Verdict.TRUE),
+    ("Verdict: accurate — the rumor that it is false is wrong", Verdict.TRUE),
+    ("**Verdict:** PARTIALLY_TRUE\nThe figure is from 2019, not 2021.", Verdict.PARTIALLY_TRUE),
+    ("Verdict - partially true; the date is wrong but nothing is false", Verdict.PARTIALLY_TRUE),
+    ("Sources disagree.\nFinal verdict: misleading, since the chart omits 2020", Verdict.MISLEADING),
+    ("Verdict: this is not true according to the census", Verdict.FALSE),
+    ("The claim is mostly true.", Verdict.PARTIALLY_TRUE),
+    ("No sources could be found.", Verdict.UNVERIFIED),
+])
+def test_parse_verdict(text, expected):
+    assert parse_verdict(text) == expected
+
+
+def test_from_text_keeps_explanation_and_evidence():
+    text = "Verdict: FALSE\nThe census (https://example.org/census.) shows otherwise."
+    result = ClaimResult.from_text("The town has 1 million people", text, elapsed_seconds=1.5)
+    assert result.verdict == Verdict.FALSE
+    assert result.evidence_urls == ["https://example.org/census"]
+    assert result.explanation == text
+    assert not result.error
+
+
+def test_failed_claim_caps_overall_verdict():
+    verified = ClaimResult(claim="A", verdict=Verdict.TRUE)
+    failed = ClaimResult.failed("B", "Verification timed out after 120s")
+    assert FactCheckResult(claims=[verified]).overall_verdict == Verdict.TRUE
+    assert FactCheckResult(claims=[verified, failed]).overall_verdict == Verdict.PARTIALLY_TRUE
+    assert not FactCheckResult(claims=[verified, failed]).complete
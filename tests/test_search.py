@@ -0,0 +1,96 @@
+import threading
+import time
+
+from fact_checker.search import CachedSearch, SearchCache
+
+
+class FakeBackend:
+    """Records the queries it receives; optionally blocks until released"""
+
+    def __init__(self, block: bool = False):
+        self.queries = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, query: str) -> dict:
+        self.queries.append(query)
+        self.started.set()
+        self.release.wait(5)
+        return {"organic": [{"title": query, "link": "https://example.org", "snippet": "..."}]}
+
+
+def make_search(backend):
+    return CachedSearch(backend=backend, cache=SearchCache(":memory:"))
+
+
+def test_miss_then_hit_for_equivalent_queries():
+    backend = FakeBackend()
+    search = make_search(backend)
+
+    first = search.search("Is the Eiffel Tower 330 metres tall?")
+    second = search.search("  is the eiffel tower 330 metres TALL ")
+
+    assert second == first
+    assert len(backend.queries) == 1
+    stats = search.stats()
+    assert (stats["requests"], stats["misses"], stats["hits"], stats["coalesced"]) == (2, 1, 1, 0)
+
+
+def test_backend_receives_the_original_query():
+    backend = FakeBackend()
+    search = make_search(backend)
+
+    search.search('"exact phrase" Census 2021?')
+
+    assert backend.queries == ['"exact phrase" Census 2021?']
+
+
+def test_identical_in_flight_queries_are_coalesced():
+    backend = FakeBackend(block=True)
+    search = make_search(backend)
+    results = []
+
+    def run(query):
+        results.append(search.search(query))
+
+    threads = [threading.Thread(target=run, args=("GDP growth 2023",))]
+    threads[0].start()
+    assert backend.started.wait(5)
+    threads += [threading.Thread(target=run, args=("gdp growth 2023.",)) for _ in range(4)]
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while search.stats()["coalesced"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    backend.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(backend.queries) == 1
+    assert len(results) == 5 and all(result == results[0] for result in results)
+    stats = search.stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 4, 0)
+
+    search.search("GDP growth 2023")
+    assert search.stats()["hits"] == 1
+    assert len(backend.queries) == 1
+
+
+def test_backend_errors_are_counted_and_not_cached():
+    calls = []
+
+    def failing(query):
+        calls.append(query)
+        raise ValueError("bad request")
+
+    search = make_search(failing)
+    for _ in range(2):
+        try:
+            search.search("anything")
+        except ValueError:
+            pass
+
+    assert len(calls) == 2
+    assert search.stats()["errors"] == 2
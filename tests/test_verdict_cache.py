@@ -0,0 +1,75 @@
+import pytest
+
+from fact_checker import settings
+from fact_checker.verdict_cache import VerdictCache, cache_key, config_version
+
+TTL = 3600
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    (tmp_path / "agents.yaml").write_text("researcher:\n  role: Researcher\n")
+    (tmp_path / "tasks.yaml").write_text("research_task:\n  description: Research\n")
+    monkeypatch.setattr(settings, "CONFIG_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def cache(clock, config_dir):
+    return VerdictCache(":memory:", ttl=TTL, max_entries=3, clock=clock)
+
+
+def test_normalized_inputs_share_an_entry(cache):
+    cache.set("The bridge opened in 1932.", '{"verdict": "TRUE"}')
+    assert cache.get("  the BRIDGE opened   in 1932. ") == '{"verdict": "TRUE"}'
+    # The same text routed as a document goes through a different crew
+    assert cache.get("The bridge opened in 1932.", input_type="document") is None
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.set("The dam was finished in 1936.", "result")
+    clock.advance(TTL - 10)
+    assert cache.get("The dam was finished in 1936.") == "result"
+    clock.advance(10)
+    assert cache.get("The dam was finished in 1936.") == "result"
+    # Reads keep an entry from being evicted, not from expiring
+    clock.advance(1)
+    assert cache.get("The dam was finished in 1936.") is None
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    for claim in ("one", "two", "three"):
+        cache.set(claim, claim)
+        clock.advance(1)
+    # Reading "one" makes "two" the least recently used
+    assert cache.get("one") == "one"
+    clock.advance(1)
+
+    cache.set("four", "four")
+    assert cache.get("two") is None
+    for claim in ("one", "three", "four"):
+        clock.advance(1)
+        assert cache.get(claim) == claim
+
+    clock.advance(1)
+    cache.set("five", "five")
+    # "one" was read before "three" and "four" in the loop above
+    assert cache.get("one") is None
+    assert [cache.get(claim) for claim in ("three", "four", "five")] == ["three", "four", "five"]
+
+
+def test_config_change_misses(cache, config_dir):
+    version = config_version()
+    cache.set("The canal was finished in 1914.", "old verdict")
+    assert cache.get("The canal was finished in 1914.") == "old verdict"
+
+    (config_dir / "tasks.yaml").write_text("research_task:\n  description: Research with primary sources\n")
+    assert config_version() != version
+    assert cache.get("The canal was finished in 1914.") is None
+    assert cache_key("The canal was finished in 1914.", version=version) != \
+        cache_key("The canal was finished in 1914.")
+
+    # Restoring the old config finds the old entry again
+    (config_dir / "tasks.yaml").write_text("research_task:\n  description: Research\n")
+    assert config_version() == version
+    assert cache.get("The canal was finished in 1914.") == "old verdict"
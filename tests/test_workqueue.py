@@ -0,0 +1,106 @@
+import pytest
+
+from fact_checker.workqueue import DEAD, DONE, LEASED, QUEUED, SQLiteQueue
+
+LEASE = 30.0
+
+
+@pytest.fixture
+def queue(clock):
+    return SQLiteQueue(":memory:", max_attempts=3, retry_backoff=10.0, clock=clock)
+
+
+def test_claim_leases_the_oldest_item(queue, clock):
+    first = queue.put("The bridge opened in 1932.")
+    clock.advance(1)
+    queue.put("The tunnel opened in 1934.")
+
+    item = queue.claim("worker-a", LEASE)
+    assert (item.id, item.attempts) == (first, 1)
+    assert queue.status(first)["status"] == LEASED
+    assert queue.claim("worker-b", LEASE).input_content == "The tunnel opened in 1934."
+    assert queue.claim("worker-c", LEASE) is None
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    item_id = queue.put("The dam was finished in 1936.")
+    assert queue.claim("worker-a", LEASE).id == item_id
+
+    clock.advance(LEASE - 1)
+    assert queue.claim("worker-b", LEASE) is None
+    # A heartbeat pushes the expiry out again
+    assert queue.heartbeat(item_id, "worker-a", LEASE)
+    clock.advance(LEASE - 1)
+    assert queue.claim("worker-b", LEASE) is None
+
+    clock.advance(2)
+    item = queue.claim("worker-b", LEASE)
+    assert (item.id, item.attempts) == (item_id, 2)
+    assert not queue.heartbeat(item_id, "worker-a", LEASE)
+
+
+def test_late_complete_from_the_old_lease_holder_is_rejected(queue, clock):
+    item_id = queue.put("The canal was finished in 1914.")
+    queue.claim("worker-a", LEASE)
+    clock.advance(LEASE + 1)
+    queue.claim("worker-b", LEASE)
+
+    assert not queue.complete(item_id, "worker-a", '{"stale": true}')
+    assert not queue.fail(item_id, "worker-a", "stale failure")
+    assert queue.status(item_id)["status"] == LEASED
+
+    assert queue.complete(item_id, "worker-b", '{"fresh": true}')
+    status = queue.status(item_id)
+    assert (status["status"], status["result"]) == (DONE, {"fresh": True})
+    # Once done, neither worker can change it
+    assert not queue.complete(item_id, "worker-b", '{"again": true}')
+
+
+def test_failed_attempts_back_off_exponentially(queue, clock):
+    item_id = queue.put("The station closed in 1966.")
+    for backoff in (10.0, 20.0):
+        queue.claim("worker", LEASE)
+        assert queue.fail(item_id, "worker", "upstream error")
+        status = queue.status(item_id)
+        assert (status["status"], status["error"]) == (QUEUED, "upstream error")
+
+        clock.advance(backoff - 1)
+        assert queue.claim("worker", LEASE) is None
+        clock.advance(1)
+        assert queue.status(item_id)["status"] == QUEUED
+    assert queue.claim("worker", LEASE).attempts == 3
+
+
+def test_item_is_dead_lettered_after_max_attempts(queue, clock):
+    item_id = queue.put("The pier burned down in 1974.")
+    for _ in range(2):
+        queue.claim("worker", LEASE)
+        queue.fail(item_id, "worker", "upstream error")
+        clock.advance(60)
+
+    assert queue.claim("worker", LEASE).attempts == 3
+    assert queue.fail(item_id, "worker", "still failing")
+    status = queue.status(item_id)
+    assert (status["status"], status["attempts"], status["error"]) == (DEAD, 3, "still failing")
+    clock.advance(3600)
+    assert queue.claim("worker", LEASE) is None
+    assert queue.stats() == {QUEUED: 0, LEASED: 0, DONE: 0, DEAD: 1}
+
+
+def test_expired_final_attempt_is_dead_lettered(queue, clock):
+    item_id = queue.put("The mill reopened in 1990.")
+    for _ in range(3):
+        assert queue.claim("worker", LEASE).id == item_id
+        clock.advance(LEASE + 1)
+
+    # The worker holding the last attempt vanished: the next claim retires the item instead of leasing it
+    assert queue.claim("worker", LEASE) is None
+    status = queue.status(item_id)
+    assert (status["status"], status["error"]) == (DEAD, "visibility timeout exceeded")
+
+
+def test_put_with_an_existing_id_is_a_no_op(queue):
+    assert queue.put("First text", item_id="batch.csv:1") == "batch.csv:1"
+    queue.put("Second text", item_id="batch.csv:1")
+    assert queue.claim("worker", LEASE).input_content == "First text"
+    assert queue.stats()[LEASED] == 1
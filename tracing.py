@@ -0,0 +1,221 @@
+import contextvars
+import json
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from . import settings
+from .progress import CLAIM_VERIFIED, TASK_FINISHED, TASK_STARTED, ProgressEvent
+
+
+class Span:
+    """One timed operation (task, tool call, cache lookup) inside a trace"""
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[str] = None, **attributes):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes = dict(attributes)
+        self.start = time.time()
+        self.end: Optional[float] = None
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.time()
+            self.trace._finished(self)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.time()) - self.start
+
+    def to_otel(self) -> dict:
+        """OpenTelemetry-style span record (one JSON line per span)"""
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": int(self.start * 1e9),
+            "endTimeUnixNano": int((self.end or self.start) * 1e9),
+            "attributes": self.attributes,
+        }
+
+
+class _NullSpan:
+    """Returned when no trace is active so instrumentation never needs to check"""
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("satyagyan_trace", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("satyagyan_span", default=None)
+_export_lock = threading.Lock()
+
+
+class Trace:
+    """All spans of one fact-check run, plus the crew task currently executing"""
+
+    def __init__(self, name: str, **attributes):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._open_tasks: Dict[str, Span] = {}
+        self.current_task: Optional[str] = None
+        self.root = Span(self, name, **attributes)
+
+    def _finished(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def parent_for_new_span(self) -> Span:
+        current = _current_span.get()
+        if current is not None and current is not self.root and current.trace is self:
+            return current
+        task_span = self._open_tasks.get(self.current_task)
+        return task_span or self.root
+
+    def on_event(self, event: ProgressEvent) -> None:
+        """Turn crew progress events into task spans (start/finish, token counts)"""
+        if event.kind == TASK_STARTED:
+            self.current_task = event.task
+            self._open_tasks[event.task] = Span(self, f"task.{event.task}", self.root.span_id, detail=event.detail)
+        elif event.kind == TASK_FINISHED:
+            span = self._open_tasks.pop(event.task, None)
+            if span is not None:
+                span.set(tokens=span.attributes.get("tokens", 0) + event.tokens,
+                         output_bytes=len((event.output or "").encode("utf-8")))
+                span.finish()
+        elif event.kind == CLAIM_VERIFIED:
+            span = self._open_tasks.get(event.task)
+            if span is not None:
+                span.set(tokens=span.attributes.get("tokens", 0) + event.tokens)
+
+    def chain(self, on_event: Optional[Callable]) -> Callable:
+        """Event callback feeding both this trace and the caller's own listener"""
+        def emit(event: ProgressEvent) -> None:
+            self.on_event(event)
+            if on_event is not None:
+                on_event(event)
+        return emit
+
+    def breakdown(self) -> dict:
+        """Per-run timing summary: tasks, tools (with cache hits and payload sizes) and estimated LLM time"""
+        with self._lock:
+            spans = list(self.spans)
+        tasks, tools = {}, {}
+        context_tokens = {"tokens_before": 0, "tokens_after": 0}
+        for span in spans:
+            if span.name == "compaction":
+                for name in context_tokens:
+                    context_tokens[name] += span.attributes.get(name, 0)
+            elif span.name.startswith("task."):
+                tasks[span.name[5:]] = {"seconds": round(span.duration, 3),
+                                        "tokens": span.attributes.get("tokens", 0)}
+            elif span.name.startswith(("tool.", "cache.")):
+                entry = tools.setdefault(span.name, {"seconds": 0.0, "calls": 0, "cache_hits": 0, "bytes": 0})
+                entry["seconds"] = round(entry["seconds"] + span.duration, 3)
+                entry["calls"] += 1
+                entry["cache_hits"] += span.attributes.get("cache") in ("hit", "fresh", "memory", "disk",
+                                                                         "coalesced", "revalidated")
+                entry["bytes"] += span.attributes.get("payload_bytes", 0)
+        task_seconds = sum(task["seconds"] for task in tasks.values())
+        tool_seconds = sum(tool["seconds"] for name, tool in tools.items() if name.startswith("tool."))
+        return {
+            "trace_id": self.trace_id,
+            "total_seconds": round(self.root.duration, 3),
+            "tasks": tasks,
+            "tools": tools,
+            # Tools run inside agent turns, so the rest of the task time is spent waiting on the LLM
+            "llm_seconds_estimate": round(max(0.0, task_seconds - tool_seconds), 3),
+            "tokens": sum(task["tokens"] for task in tasks.values()),
+            "context_tokens": context_tokens,
+        }
+
+    def export(self) -> None:
+        """Append every span to the JSON-lines trace file (if enabled)"""
+        if not settings.TRACE_FILE:
+            return
+        path = Path(settings.TRACE_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            lines = [json.dumps(span.to_otel(), default=str) for span in self.spans]
+        with _export_lock, open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+@contextmanager
+def trace(name: str, **attributes):
+    """
+    Start a trace for one run and make it current. If a trace is already
+    active (e.g. a job wrapping the pipeline) the existing one is reused.
+    """
+    active = _current_trace.get()
+    if active is not None:
+        active.root.set(**attributes)
+        yield active
+        return
+    run = Trace(name, **attributes)
+    trace_token = _current_trace.set(run)
+    span_token = _current_span.set(run.root)
+    try:
+        yield run
+    except Exception as e:
+        run.root.set(error=str(e))
+        raise
+    finally:
+        for span in list(run._open_tasks.values()):
+            span.set(error="unfinished")
+            span.finish()
+        run.root.finish()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        run.export()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Time a block as a child span of the current one; a no-op outside a trace"""
+    run = _current_trace.get()
+    if run is None:
+        yield _NULL_SPAN
+        return
+    parent = run.parent_for_new_span()
+    if run.current_task and "task" not in attributes:
+        attributes["task"] = run.current_task
+    current = Span(run, name, parent.span_id, **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.set(error=str(e))
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+
+
+def annotate(**attributes) -> None:
+    """Attach attributes (cache outcome, sizes) to whatever span is current"""
+    current = _current_span.get()
+    if current is not None:
+        current.set(**attributes)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def propagate(func: Callable) -> Callable:
+    """Bind func to a copy of the caller's context so worker threads join the current trace"""
+    context = contextvars.copy_context()
+    # A context can't be entered by two threads at once, so every call gets its own copy
+    return lambda *args, **kwargs: context.copy().run(func, *args, **kwargs)
@@ -0,0 +1,138 @@
+import contextvars
+import gzip
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from . import settings
+from .ratelimit import get_limiter
+from .tracing import annotate
+
+YOUTUBE_ID_PATTERN = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?#]+)')
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Return the video ID from a YouTube URL, or None if it isn't one"""
+    match = YOUTUBE_ID_PATTERN.search(url or "")
+    return match.group(1) if match else None
+
+
+def download_transcript(video_id: str) -> str:
+    """Fetch a transcript from YouTube and flatten it to plain text"""
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    if hasattr(YouTubeTranscriptApi, "get_transcript"):
+        segments = YouTubeTranscriptApi.get_transcript(video_id)
+        return " ".join(segment["text"] for segment in segments)
+    segments = YouTubeTranscriptApi().fetch(video_id)
+    return " ".join(segment.text for segment in segments)
+
+
+class TranscriptStore:
+    """Video-ID keyed transcript cache: in-memory LRU in front of gzip files on disk"""
+
+    def __init__(self, cache_dir=None, max_memory_items: int = settings.TRANSCRIPT_MEMORY_ITEMS,
+                 downloader=download_transcript):
+        self.cache_dir = Path(cache_dir or settings.CACHE_DIR / "transcripts")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_items = max_memory_items
+        self.downloader = downloader
+        self._memory = OrderedDict()
+        self._pending = {}
+        # Re-entrant: a prefetch that finishes instantly runs _forget while _submit holds the lock
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcript-prefetch")
+
+    def _path(self, video_id: str):
+        return self.cache_dir / (re.sub(r"[^\w-]", "_", video_id) + ".txt.gz")
+
+    def _remember(self, video_id: str, text: str) -> None:
+        with self._lock:
+            self._memory[video_id] = text
+            self._memory.move_to_end(video_id)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def cached(self, video_id: str) -> Optional[str]:
+        """Return a locally stored transcript without touching the network"""
+        with self._lock:
+            if video_id in self._memory:
+                self._memory.move_to_end(video_id)
+                return self._memory[video_id]
+        path = self._path(video_id)
+        if path.exists():
+            text = gzip.decompress(path.read_bytes()).decode("utf-8")
+            self._remember(video_id, text)
+            return text
+        return None
+
+    def _load(self, video_id: str) -> str:
+        text = self.cached(video_id)
+        if text is None:
+            text = get_limiter("transcript").call(self.downloader, video_id)
+            tmp = self._path(video_id).with_suffix(".tmp")
+            tmp.write_bytes(gzip.compress(text.encode("utf-8")))
+            tmp.replace(self._path(video_id))
+            self._remember(video_id, text)
+        return text
+
+    def _submit(self, video_id: str) -> Future:
+        with self._lock:
+            future = self._pending.get(video_id)
+            if future is None:
+                # Run in the caller's context so the download keeps its priority (e.g. BATCH)
+                future = self._executor.submit(contextvars.copy_context().run, self._load, video_id)
+                self._pending[video_id] = future
+                future.add_done_callback(lambda _: self._forget(video_id))
+            return future
+
+    def _forget(self, video_id: str) -> None:
+        with self._lock:
+            self._pending.pop(video_id, None)
+
+    def prefetch(self, video_id: str) -> None:
+        """Start downloading a transcript in the background if it isn't local yet"""
+        if self.cached(video_id) is None:
+            self._submit(video_id)
+
+    def get(self, video_id: str) -> str:
+        """Return a transcript, joining an in-flight prefetch instead of downloading twice"""
+        text = self.cached(video_id)
+        if text is not None:
+            annotate(cache="hit")
+            return text
+        annotate(cache="miss")
+        return self._submit(video_id).result(timeout=settings.FETCH_TIMEOUT * 4)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> TranscriptStore:
+    """Process-wide transcript store shared by the UI and every crew run"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TranscriptStore()
+        return _store
+
+
+def configure_transcript_store(**kwargs) -> TranscriptStore:
+    """Replace the shared store, e.g. with a private cache directory or a recorded downloader"""
+    global _store
+    with _store_lock:
+        _store = TranscriptStore(**kwargs)
+        return _store
+
+
+def prefetch_transcript(url: str) -> bool:
+    """Warm the transcript cache for a YouTube URL; returns False if the URL has no video ID"""
+    video_id = extract_video_id(url)
+    if video_id is None:
+        return False
+    get_transcript_store().prefetch(video_id)
+    return True
@@ -0,0 +1,122 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import settings
+
+
+def normalize_input(input_content: str) -> str:
+    """Normalize input so trivially different submissions share a cache key"""
+    text = " ".join(unicodedata.normalize("NFKC", input_content or "").split())
+    # URLs (and YouTube video IDs) are case-sensitive, free text is not
+    if re.match(r"https?://", text, re.IGNORECASE):
+        return text
+    return text.casefold()
+
+
+def config_version() -> str:
+    """Hash of the agents/tasks YAML so config edits invalidate cached verdicts"""
+    digest = hashlib.sha256()
+    for name in ("agents.yaml", "tasks.yaml"):
+        path = settings.CONFIG_DIR / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_key(input_content: str, version: Optional[str] = None, input_type: Optional[str] = None) -> str:
+    """
+    Content-addressed key for an input under a given config version. input_type
+    is the route the input takes (see routing.effective_type): the same text
+    checked as a claim and as a document goes through different crews.
+    """
+    version = version if version is not None else config_version()
+    payload = f"{version}\0{normalize_input(input_content)}"
+    if input_type:
+        payload += f"\0{input_type}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """SQLite-backed verdict store with TTL expiry and LRU eviction"""
+
+    def __init__(self, path=None, ttl: int = settings.VERDICT_CACHE_TTL,
+                 max_entries: int = settings.VERDICT_CACHE_MAX_ENTRIES, clock: Callable[[], float] = time.time):
+        self.path = path or settings.CACHE_DIR / "verdicts.sqlite3"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " key TEXT PRIMARY KEY,"
+            " result TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_accessed ON verdicts(accessed_at)")
+        self._conn.commit()
+
+    def get(self, input_content: str, input_type: Optional[str] = None) -> Optional[str]:
+        """Return the cached report for this input, or None if missing/expired"""
+        key = cache_key(input_content, input_type=input_type)
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            result, created_at = row
+            if self.ttl and now - created_at > self.ttl:
+                self._conn.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE verdicts SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return result
+
+    def set(self, input_content: str, result: str, input_type: Optional[str] = None) -> None:
+        """Store a report and evict least recently used entries beyond the limit"""
+        key = cache_key(input_content, input_type=input_type)
+        now = self.clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, result, now, now),
+            )
+            if self.ttl:
+                self._conn.execute("DELETE FROM verdicts WHERE created_at < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE key IN ("
+                " SELECT key FROM verdicts ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM verdicts")
+            self._conn.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Process-wide verdict cache shared by every Streamlit session"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = VerdictCache()
+        return _cache
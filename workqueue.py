@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+import hmac
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional
+
+from . import settings
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+
+TOKEN_HEADER = "X-Queue-Token"
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+@dataclass
+class WorkItem:
+    """One fact check leased to a worker"""
+    id: str
+    input_content: str
+    input_type: Optional[str] = None
+    attempts: int = 0
+
+
+class QueueBackend(ABC):
+    """
+    Durable work queue interface. Leased items become visible again once their
+    visibility timeout passes without a heartbeat, so crashed workers' items are
+    retried (up to max_attempts, then marked dead).
+    """
+
+    @abstractmethod
+    def put(self, input_content: str, input_type: Optional[str] = None, item_id: Optional[str] = None) -> str:
+        """Enqueue an item (a no-op if item_id is already queued); returns its ID"""
+
+    @abstractmethod
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[WorkItem]:
+        """Lease the oldest ready item to worker_id, or return None if there is none"""
+
+    @abstractmethod
+    def heartbeat(self, item_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        """Extend a lease; False if the worker no longer holds it"""
+
+    @abstractmethod
+    def complete(self, item_id: str, worker_id: str, result: str) -> bool:
+        """Publish a result for a leased item"""
+
+    @abstractmethod
+    def fail(self, item_id: str, worker_id: str, error: str) -> bool:
+        """Report a failed attempt on a leased item"""
+
+    @abstractmethod
+    def status(self, item_id: str) -> Optional[dict]:
+        """Status, attempts, result and error of one item"""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Item counts by status"""
+
+
+class SQLiteQueue(QueueBackend):
+    """
+    Single-host backend: any number of worker processes share one SQLite file.
+    clock supplies lease and backoff timestamps (wall-clock time by default,
+    since processes compare them across restarts).
+    """
+
+    def __init__(self, path=None, max_attempts: int = settings.WORK_MAX_ATTEMPTS,
+                 retry_backoff: float = settings.WORK_RETRY_BACKOFF, clock: Callable[[], float] = time.time):
+        self.path = path or settings.CACHE_DIR / "workqueue.sqlite3"
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.clock = clock
+        self._lock = threading.Lock()
+        if str(self.path) != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode so claims can take an explicit write lock across processes
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS work_items ("
+            " id TEXT PRIMARY KEY,"
+            " input_content TEXT NOT NULL,"
+            " input_type TEXT,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " lease_owner TEXT,"
+            " lease_expires REAL,"
+            " available_at REAL NOT NULL,"
+            " result TEXT,"
+            " error TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_work_items_ready ON work_items(status, available_at);"
+        )
+
+    def put(self, input_content: str, input_type: Optional[str] = None, item_id: Optional[str] = None) -> str:
+        item_id = item_id or uuid.uuid4().hex
+        now = self.clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO work_items (id, input_content, input_type, status, available_at,"
+                " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (item_id, input_content, input_type, QUEUED, now, now, now),
+            )
+        return item_id
+
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[WorkItem]:
+        now = self.clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Leases whose worker stopped heart-beating are out of attempts or go back in the queue
+                self._conn.execute(
+                    "UPDATE work_items SET status = ?, error = 'visibility timeout exceeded', updated_at = ?"
+                    " WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                    (DEAD, now, LEASED, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    "SELECT id, input_content, input_type, attempts FROM work_items"
+                    " WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?)"
+                    " ORDER BY created_at LIMIT 1",
+                    (QUEUED, now, LEASED, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE work_items SET status = ?, attempts = attempts + 1, lease_owner = ?,"
+                        " lease_expires = ?, updated_at = ? WHERE id = ?",
+                        (LEASED, worker_id, now + visibility_timeout, now, row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return WorkItem(id=row[0], input_content=row[1], input_type=row[2], attempts=row[3] + 1)
+
+    def _update_lease(self, sql: str, params: tuple) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(sql + " WHERE id = ? AND status = ? AND lease_owner = ?", params)
+        return cursor.rowcount == 1
+
+    def heartbeat(self, item_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        now = self.clock()
+        return self._update_lease("UPDATE work_items SET lease_expires = ?, updated_at = ?",
+                                  (now + visibility_timeout, now, item_id, LEASED, worker_id))
+
+    def complete(self, item_id: str, worker_id: str, result: str) -> bool:
+        """Publish a result; ignored if the lease was lost to another worker meanwhile"""
+        return self._update_lease("UPDATE work_items SET status = ?, result = ?, error = NULL,"
+                                  " lease_owner = NULL, updated_at = ?",
+                                  (DONE, result, self.clock(), item_id, LEASED, worker_id))
+
+    def fail(self, item_id: str, worker_id: str, error: str) -> bool:
+        """Requeue with exponential backoff, or mark dead once attempts are used up"""
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM work_items WHERE id = ?", (item_id,)).fetchone()
+        if row is None:
+            return False
+        now = self.clock()
+        if row[0] >= self.max_attempts:
+            return self._update_lease("UPDATE work_items SET status = ?, error = ?, lease_owner = NULL,"
+                                      " updated_at = ?", (DEAD, error, now, item_id, LEASED, worker_id))
+        return self._update_lease("UPDATE work_items SET status = ?, error = ?, lease_owner = NULL,"
+                                  " available_at = ?, updated_at = ?",
+                                  (QUEUED, error, now + self.retry_backoff * 2 ** (row[0] - 1), now,
+                                   item_id, LEASED, worker_id))
+
+    def status(self, item_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, attempts, result, error, created_at, updated_at FROM work_items WHERE id = ?",
+                (item_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"id": item_id, "status": row[0], "attempts": row[1],
+                "result": json.loads(row[2]) if row[2] else None, "error": row[3],
+                "created_at": row[4], "updated_at": row[5]}
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM work_items GROUP BY status").fetchall()
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0, DEAD: 0}
+        counts.update(dict(rows))
+        return counts
+
+
+class HTTPQueue(QueueBackend):
+    """
+    Networked backend for workers on other machines. It speaks a small JSON
+    protocol served by serve_queue() (the local stand-in); a managed broker can
+    replace it by implementing the same QueueBackend methods.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30, token: str = settings.WORK_QUEUE_TOKEN):
+        import requests
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        if token:
+            self.session.headers[TOKEN_HEADER] = token
+
+    def _call(self, method: str, **kwargs):
+        response = self.session.post(f"{self.base_url}/{method}", json=kwargs, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get("value")
+
+    def put(self, input_content, input_type=None, item_id=None):
+        return self._call("put", input_content=input_content, input_type=input_type, item_id=item_id)
+
+    def claim(self, worker_id, visibility_timeout):
+        item = self._call("claim", worker_id=worker_id, visibility_timeout=visibility_timeout)
+        return WorkItem(**item) if item else None
+
+    def heartbeat(self, item_id, worker_id, visibility_timeout):
+        return self._call("heartbeat", item_id=item_id, worker_id=worker_id, visibility_timeout=visibility_timeout)
+
+    def complete(self, item_id, worker_id, result):
+        return self._call("complete", item_id=item_id, worker_id=worker_id, result=result)
+
+    def fail(self, item_id, worker_id, error):
+        return self._call("fail", item_id=item_id, worker_id=worker_id, error=error)
+
+    def status(self, item_id):
+        return self._call("status", item_id=item_id)
+
+    def stats(self):
+        return self._call("stats")
+
+
+QUEUE_METHODS = ("put", "claim", "heartbeat", "complete", "fail", "status", "stats")
+
+
+def serve_queue(backend: QueueBackend, host: str = settings.WORK_QUEUE_HOST,
+                port: int = settings.WORK_QUEUE_PORT, token: str = settings.WORK_QUEUE_TOKEN) -> ThreadingHTTPServer:
+    """
+    Expose a backend (normally SQLiteQueue) to HTTPQueue clients on other nodes.
+    Every request must carry the shared token; listening beyond localhost
+    without one is refused, since anyone who can reach the port could read
+    results and submit work.
+    """
+    if not token and host not in LOCAL_HOSTS:
+        raise ValueError(f"Set SATYAGYAN_WORK_QUEUE_TOKEN before serving the work queue on {host}")
+
+    class QueueHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, body: dict) -> None:
+            payload = json.dumps(body, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            if token and not hmac.compare_digest(self.headers.get(TOKEN_HEADER, ""), token):
+                self.close_connection = True
+                return self._send(401, {"error": "missing or wrong queue token"})
+            method = self.path.strip("/")
+            if method not in QUEUE_METHODS:
+                return self._send(404, {"error": "unknown method"})
+            try:
+                kwargs = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                value = getattr(backend, method)(**kwargs)
+            except (TypeError, ValueError) as e:
+                return self._send(400, {"error": str(e)})
+            self._send(200, {"value": asdict(value) if isinstance(value, WorkItem) else value})
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), QueueHandler)
+
+
+def open_queue(url: str = settings.WORK_QUEUE_URL) -> QueueBackend:
+    """sqlite:///path/to/queue.sqlite3 for one host, http://host:port for a networked queue"""
+    if url.startswith(("http://", "https://")):
+        return HTTPQueue(url)
+    if url.startswith("sqlite://"):
+        return SQLiteQueue(url[len("sqlite://"):] or None)
+    raise ValueError(f"Unsupported work queue URL: {url}")
+
+
+def run_worker(queue: QueueBackend, runner: Callable = None, worker_id: Optional[str] = None,
+               visibility_timeout: float = settings.WORK_VISIBILITY_TIMEOUT,
+               poll_interval: float = settings.WORK_POLL_INTERVAL,
+               stop: threading.Event = None, max_items: Optional[int] = None) -> int:
+    """
+    Pull items until stopped: run each fact check, keep its lease alive with
+    heartbeats, then publish the result (or report the failure for retry).
+    Returns the number of items processed.
+    """
+    if runner is None:
+        from .pipeline import run_fact_check
+        runner = run_fact_check
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+    stop = stop or threading.Event()
+    processed = 0
+
+    while not stop.is_set() and (max_items is None or processed < max_items):
+        try:
+            item = queue.claim(worker_id, visibility_timeout)
+        except Exception as e:
+            print(f"[{worker_id}] queue unavailable: {e}")
+            stop.wait(poll_interval)
+            continue
+        if item is None:
+            stop.wait(poll_interval)
+            continue
+
+        done = threading.Event()
+
+        def keep_alive(item_id=item.id):
+            while not done.wait(visibility_timeout / 3):
+                try:
+                    if not queue.heartbeat(item_id, worker_id, visibility_timeout):
+                        return
+                except Exception:
+                    pass
+
+        heartbeat = threading.Thread(target=keep_alive, daemon=True)
+        heartbeat.start()
+        try:
+            try:
+                result = runner(item.input_content, input_type=item.input_type)
+                queue.complete(item.id, worker_id, result.model_dump_json())
+            except Exception as e:
+                queue.fail(item.id, worker_id, str(e))
+        except Exception as e:
+            # The queue is unreachable; the lease expires and another worker retries the item
+            print(f"[{worker_id}] could not report {item.id}: {e}")
+        finally:
+            done.set()
+            heartbeat.join()
+        processed += 1
+    return processed
+
+
+def main():
+    """
+    Durable multi-node work queue.
+    Usage:
+      workqueue serve [port] [host]           expose the local SQLite queue to other nodes
+      workqueue worker [threads]              pull and run checks from SATYAGYAN_WORK_QUEUE_URL
+      workqueue submit <inputs.jsonl|csv>     enqueue every item of a batch file
+      workqueue status [item_id]              queue counts, or one item's status/result
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    if command == "serve":
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else settings.WORK_QUEUE_PORT
+        host = sys.argv[3] if len(sys.argv) > 3 else settings.WORK_QUEUE_HOST
+        server = serve_queue(SQLiteQueue(), host=host, port=port)
+        print(f"Work queue listening on {host}:{port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    elif command == "worker":
+        queue = open_queue()
+        threads = [threading.Thread(target=run_worker, args=(queue,), daemon=True)
+                   for _ in range(int(sys.argv[2]) if len(sys.argv) > 2 else 1)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            pass
+    elif command == "submit":
+        from .batch import read_inputs
+        queue = open_queue()
+        count = 0
+        for item in read_inputs(sys.argv[2]):
+            # Batch item IDs double as queue IDs, so resubmitting a file doesn't duplicate work
+            queue.put(item["input_content"], item_id=f"{Path(sys.argv[2]).name}:{item['id']}")
+            count += 1
+        print(f"Queued {count} item(s)")
+    elif command == "status":
+        queue = open_queue()
+        print(json.dumps(queue.status(sys.argv[2]) if len(sys.argv) > 2 else queue.stats(), indent=2))
+    else:
+        print(main.__doc__)
+
+
+if __name__ == "__main__":
+    main()